@@ -1,35 +1,91 @@
+import functools
 import os
+import re
 
 from dotenv import load_dotenv
-from flask import Flask
+from flask import Flask, g, has_request_context, request
 from flask_login import LoginManager
 from flask_wtf.csrf import CSRFProtect
+from markupsafe import Markup, escape
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
 
 from config import DevelopmentConfig, ProductionConfig, TestingConfig
 from models import User, db
 from routes import init_app as init_routes
-
-# Load environment variables from .env file as early as possible
-load_dotenv()
+from services.nav_sessions import get_nav_sessions_for_current_user
 
 # Extensions (initialized without app; bound in create_app)
 login_manager = LoginManager()
 csrf = CSRFProtect()
 
+# Matches both Unix and Windows line endings for the nl2br filter
+_NEWLINE_RE = re.compile(r"\r?\n")
+
+# Database URIs whose schema has already been created in this process
+_SCHEMA_INITIALIZED: set[str] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> bool:
+    """Load the .env file once per process (set DATADECK_SKIP_DOTENV=1 to skip)."""
+    if os.environ.get("DATADECK_SKIP_DOTENV") == "1":
+        return False
+    return load_dotenv()
+
+
+def _count_statement(*_args):
+    if has_request_context() and "query_count" in g:
+        g.query_count += 1
+
+
+def _install_admin_query_budget(app: Flask, budget: int) -> None:
+    """Warn when a request under /admin runs more than ``budget`` statements."""
+    # Listen on the Engine class so statements on any bind are counted
+    if not event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.listen(Engine, "before_cursor_execute", _count_statement)
+
+    @app.before_request
+    def start_query_count():
+        if request.path.startswith("/admin"):
+            g.query_count = 0
+
+    @app.after_request
+    def check_query_count(response):
+        count = g.pop("query_count", None)
+        if count is not None and count > budget:
+            app.logger.warning(
+                "%s %s ran %d SQL statements (budget %d)",
+                request.method,
+                request.path,
+                count,
+                budget,
+            )
+        return response
+
 
 def create_app(config_name: str | None = None) -> Flask:
     """Application factory for DataDeck v2."""
+    _load_env_once()
     app = Flask(__name__)
 
     # Select config
     env = (config_name or os.environ.get("FLASK_ENV", "development")).lower()
     if env == "production":
         app.config.from_object(ProductionConfig)
+        # Read here rather than in config.py so a value from .env is honoured
+        app.config["AUTO_CREATE_SCHEMA"] = os.environ.get("AUTO_CREATE_SCHEMA") == "1"
     elif env == "testing" or env == "test":
         app.config.from_object(TestingConfig)
     else:
         app.config.from_object(DevelopmentConfig)
 
+    # Resolve all mapper relationships now rather than on the first query
+    # (no-op after the first call in a process)
+    configure_mappers()
+
     # Initialize extensions
     db.init_app(app)
     login_manager.init_app(app)
@@ -50,27 +106,42 @@ def create_app(config_name: str | None = None) -> Flask:
     # Custom Jinja filters
     @app.template_filter("nl2br")
     def nl2br_filter(text):
-        """Convert newlines to HTML line breaks."""
+        """Escape text and convert newlines to HTML line breaks."""
         if not text:
             return text
-        return text.replace("\n", "<br>\n")
+        return Markup(_NEWLINE_RE.sub("<br>\n", str(escape(text))))
 
     # Template context processors
+    @app.before_request
+    def reset_request_cache():
+        # g outlives a request when the caller already holds an app context
+        for key in ("nav_sessions", "is_admin_or_staff", "query_count"):
+            g.pop(key, None)
+
     @app.context_processor
     def inject_nav_sessions():
         """Make nav session helper available to all templates."""
-        try:
-            from services.nav_sessions import get_nav_sessions_for_current_user
-
-            nav_sessions = get_nav_sessions_for_current_user()
-            return {"nav_sessions": nav_sessions}
-        except Exception:
-            # Graceful fallback if helper fails
-            return {"nav_sessions": {"type": "none", "data": None}}
-
-    # Create DB schema on startup (no Alembic in current phase)
-    with app.app_context():
-        db.create_all()
+        # Computed once per request even if several templates are rendered
+        if "nav_sessions" not in g:
+            try:
+                g.nav_sessions = get_nav_sessions_for_current_user()
+            except (AttributeError, SQLAlchemyError) as e:
+                # Graceful fallback if helper fails
+                app.logger.warning("nav_sessions failed: %s", e)
+                g.nav_sessions = {"type": "none", "data": None}
+        return {"nav_sessions": g.nav_sessions}
+
+    # Dev-time N+1 tripwire for the admin views
+    if app.config.get("ADMIN_QUERY_BUDGET") is not None:
+        _install_admin_query_budget(app, app.config["ADMIN_QUERY_BUDGET"])
+
+    # Create DB schema on startup (no Alembic in current phase), once per
+    # database per process
+    uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    if app.config.get("AUTO_CREATE_SCHEMA", False) and uri not in _SCHEMA_INITIALIZED:
+        with app.app_context():
+            db.create_all()
+        _SCHEMA_INITIALIZED.add(uri)
 
     return app
 
@@ -1,21 +1,45 @@
 # config.py
 import os
 
+from sqlalchemy.pool import StaticPool
+
 
 class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "your_secret_key")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Run db.create_all() at startup (no Alembic in current phase)
+    AUTO_CREATE_SCHEMA = True
+    # Room for every distinct ORM statement shape in the compiled-SQL cache
+    # (SQLAlchemy's default is 500)
+    SQLALCHEMY_ENGINE_OPTIONS = {"query_cache_size": 1200}
+    # Make eager-loaded view queries raise on any other lazy load (see
+    # routes.admin._user_list_query); on under tests to catch N+1 regressions
+    STRICT_LOADING = False
+    # Log a warning when an /admin request runs more SQL statements than this
+    # (None disables the per-request statement counter)
+    ADMIN_QUERY_BUDGET = None
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///your_database.db"
+    ADMIN_QUERY_BUDGET = 15
 
 
 class TestingConfig(Config):
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = "sqlite:///test_database.db"
+    # In-memory SQLite on a single shared connection: no filesystem I/O, and
+    # every pytest-xdist worker process gets its own private database
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
     WTF_CSRF_ENABLED = False
+    STRICT_LOADING = True
+    # The test fixtures build the schema themselves
+    AUTO_CREATE_SCHEMA = False
 
 
 class ProductionConfig(Config):
@@ -24,3 +48,6 @@ class ProductionConfig(Config):
     if uri and uri.startswith("postgres://"):
         uri = uri.replace("postgres://", "postgresql://", 1)
     SQLALCHEMY_DATABASE_URI = uri
+    # Deployed instances skip schema creation unless AUTO_CREATE_SCHEMA=1 is set;
+    # create_app reads that variable after loading .env
+    AUTO_CREATE_SCHEMA = False
@@ -1,21 +1,116 @@
 import pytest
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
 
 from app import create_app
 from config import TestingConfig
 from models import db
+from services.dashboard_counts import clear_dashboard_counts_cache
+from services.dashboard_lists import clear_dashboard_lists_cache
+from services.login_choices import clear_login_choices_cache
+from services.module_choices import clear_module_choices_cache
 
 
-@pytest.fixture
+class _ConnectionBoundSession(FlaskSession):
+    """Session that always uses the test's connection.
+
+    Flask-SQLAlchemy's ``get_bind`` resolves the engine from the model's bind key,
+    which would open a fresh connection outside the per-test transaction.
+    """
+
+    def get_bind(self, *args, **kwargs):
+        return self.bind
+
+
+class _PerTestScopedSession(scoped_session):
+    """One session shared by every app context pushed during a test.
+
+    Fixtures and tests push their own app contexts; separate sessions would each
+    open a SAVEPOINT on the shared connection and release them out of order.
+    Flask-SQLAlchemy removes the session on every app-context teardown, so that
+    is a no-op here and ``db_session`` closes the session itself.
+    """
+
+    def remove(self):
+        pass
+
+    def close_for_test(self):
+        super().remove()
+
+
+def _enable_sqlite_savepoints(engine):
+    """Let pysqlite honour SAVEPOINT by handing BEGIN control to SQLAlchemy."""
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
 def app():
+    """Build the app and its schema once for the whole test session."""
     test_app = create_app("testing")
     # Ensure testing config is applied (factory does this for 'testing')
     test_app.config.from_object(TestingConfig)
 
     with test_app.app_context():
-        db.create_all()
-        yield test_app
+        in_memory = db.engine.dialect.name == "sqlite" and not db.engine.url.database
+        if db.engine.dialect.name == "sqlite":
+            db.engine.dispose()
+            _enable_sqlite_savepoints(db.engine)
+        if not in_memory:
+            db.drop_all()
+        # A freshly opened in-memory database has no tables to probe for
+        db.metadata.create_all(db.engine, checkfirst=not in_memory)
+
+    yield test_app
+
+    with test_app.app_context():
         db.session.remove()
-        db.drop_all()
+        if not in_memory:
+            db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def db_session(app):
+    """Run each test inside an outer transaction that is rolled back afterwards.
+
+    Follows SQLAlchemy's "join a session into an external transaction" recipe:
+    commits made by tests and views only release a SAVEPOINT, so every test
+    starts from the empty schema without paying for DDL again.
+    """
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        original_session = db.session
+        db.session = _PerTestScopedSession(
+            db._make_session_factory(
+                {
+                    "class_": _ConnectionBoundSession,
+                    "query_cls": db.Query,
+                    "bind": connection,
+                    "join_transaction_mode": "create_savepoint",
+                }
+            )
+        )
+        try:
+            yield db.session
+        finally:
+            db.session.close_for_test()
+            db.session = original_session
+            transaction.rollback()
+            connection.close()
+            # Rolled-back rows must not survive in process-local caches
+            clear_login_choices_cache()
+            clear_dashboard_counts_cache()
+            clear_dashboard_lists_cache()
+            clear_module_choices_cache()
 
 
 @pytest.fixture
@@ -30,7 +125,38 @@ def runner(app):
 
 # Student Management Test Fixtures (M4)
 @pytest.fixture
-def teacher_user(app):
+def base_hierarchy(db_session):
+    """District, school, teacher and module shared by the factory fixtures.
+
+    Built on first use and rolled back with the test, so factories only create
+    the leaf rows they are asked for.
+    """
+    from tests.factories import (
+        create_district,
+        create_module,
+        create_school,
+        create_teacher,
+    )
+
+    cache = {}
+
+    def _get(key):
+        if not cache:
+            district = create_district()
+            school = create_school(district)
+            cache.update(
+                district=district,
+                school=school,
+                teacher=create_teacher(district, school),
+                module=create_module(),
+            )
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture
+def teacher_user(db_session):
     """Create a teacher user for testing."""
     from tests.factories import create_district, create_school, create_teacher
 
@@ -42,7 +168,7 @@ def teacher_user(app):
 
 
 @pytest.fixture
-def observer_user(app):
+def observer_user(db_session):
     """Create an observer user for testing."""
     from werkzeug.security import generate_password_hash
 
@@ -60,34 +186,28 @@ def observer_user(app):
 
 
 @pytest.fixture
-def student_factory(app):
+def student_factory(base_hierarchy):
     """Factory for creating students."""
 
     def _create_student(**kwargs):
         from models import User
-        from tests.factories import create_module, create_session, create_student
+        from tests.factories import create_session, create_student
 
-        # Get or create teacher
+        # Get teacher, defaulting to the shared one
         teacher_id = kwargs.get("teacher_id")
         if teacher_id:
-            teacher = User.query.get(teacher_id)
+            teacher = db.session.get(User, teacher_id)
         else:
-            from tests.factories import create_district, create_school, create_teacher
-
-            district = create_district()
-            school = create_school(district)
-            teacher = create_teacher(district, school)
-            teacher_id = teacher.id
+            teacher = base_hierarchy("teacher")
 
         # Get or create session
         section_id = kwargs.get("section_id")
         if section_id:
             from models import Session
 
-            session = Session.query.get(section_id)
+            session = db.session.get(Session, section_id)
         else:
-            module = create_module()
-            session = create_session(teacher, module=module)
+            session = create_session(teacher, module=base_hierarchy("module"))
 
         student = create_student(teacher, session)
 
@@ -103,25 +223,20 @@ def student_factory(app):
 
 
 @pytest.fixture
-def session_factory(app):
+def session_factory(base_hierarchy):
     """Factory for creating sessions."""
 
     def _create_session(**kwargs):
         from models import User
-        from tests.factories import create_module, create_session
+        from tests.factories import create_session
 
         created_by_id = kwargs.get("created_by_id")
         if created_by_id:
-            teacher = User.query.get(created_by_id)
+            teacher = db.session.get(User, created_by_id)
         else:
-            from tests.factories import create_district, create_school, create_teacher
+            teacher = base_hierarchy("teacher")
 
-            district = create_district()
-            school = create_school(district)
-            teacher = create_teacher(district, school)
-
-        module = create_module()
-        session = create_session(teacher, module=module)
+        session = create_session(teacher, module=base_hierarchy("module"))
 
         # Override any provided attributes
         for key, value in kwargs.items():
@@ -135,15 +250,13 @@ def session_factory(app):
 
 
 @pytest.fixture
-def teacher_factory(app):
+def teacher_factory(base_hierarchy):
     """Factory for creating teachers."""
 
     def _create_teacher(**kwargs):
-        from tests.factories import create_district, create_school, create_teacher
+        from tests.factories import create_teacher
 
-        district = create_district()
-        school = create_school(district)
-        teacher = create_teacher(district, school)
+        teacher = create_teacher(base_hierarchy("district"), base_hierarchy("school"))
 
         # Override any provided attributes
         for key, value in kwargs.items():
@@ -157,19 +270,15 @@ def teacher_factory(app):
 
 
 @pytest.fixture
-def session_with_students(app, teacher_user):
+def session_with_students(db_session, teacher_user):
     """Create a session with multiple students for testing."""
     from tests.factories import create_module, create_session, create_student
 
     module = create_module("Test Module")
     session = create_session(teacher_user, section=1, module=module)
 
-    # Create 3 students for the session
-    students = []
-    for i in range(3):
-        student = create_student(teacher_user, session)
-        students.append(student)
-
+    # Create 3 students for the session, inserted in a single flush
+    students = [create_student(teacher_user, session, flush=False) for _ in range(3)]
     db.session.commit()
     session.test_students = students  # Attach for easy access in tests
     return session
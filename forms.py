@@ -1,5 +1,6 @@
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileAllowed, FileRequired
+from sqlalchemy import select
 from wtforms import (
     BooleanField,
     DateField,
@@ -22,54 +23,116 @@ from wtforms.validators import (
 )
 
 from models import db
-from models.district import District
-from models.module import Module
-from models.school import School
 from models.user import User
+from services.login_choices import get_district_choices, get_school_choices
+from services.module_choices import get_module_choices
+
+# Shared validator chains; validators are stateless, so one instance serves
+# every field that uses them
+_REQUIRED = (DataRequired(),)
+_REQUIRED_EMAIL = (DataRequired(), Email())
+_OPTIONAL = (Optional(),)
+_OPTIONAL_ID = (Optional(), NumberRange(min=1))
+
+
+def _strip(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+# Static choice lists, built once at import time
+_ROLE_CHOICES = tuple((role.value, role.value.title()) for role in User.Role)
+_CHARACTER_SET_CHOICES = (
+    ("animals", "Animals"),
+    ("superheroes", "Superheroes"),
+    ("fantasy", "Fantasy Characters"),
+    ("space", "Space Explorers"),
+)
+_MODULE_STATUS_CHOICES = ((True, "Active"), (False, "Inactive"))
+_SESSION_STATUS_CHOICES = (
+    ("", "All Statuses"),
+    ("active", "Active"),
+    ("archived", "Archived"),
+    ("paused", "Paused"),
+)
+_MEDIA_TYPE_FILTER_CHOICES = (
+    ("", "All Types"),
+    ("image", "Images"),
+    ("video", "Videos"),
+)
+_IS_GRAPH_FILTER_CHOICES = (
+    ("", "All Content"),
+    ("true", "Graph Content Only"),
+    ("false", "Non-Graph Content Only"),
+)
+_POSTED_BY_FILTER_CHOICES = (
+    ("", "All Authors"),
+    ("students", "Students"),
+    ("teacher", "Teacher"),
+)
+_GRAPH_TYPE_CHOICES = (
+    ("", "Select graph type (optional)"),
+    ("bar_chart", "Bar Chart"),
+    ("line_graph", "Line Graph"),
+    ("pie_chart", "Pie Chart"),
+    ("scatter_plot", "Scatter Plot"),
+    ("histogram", "Histogram"),
+    ("box_plot", "Box Plot"),
+    ("other", "Other Graph Type"),
+)
+_PROJECT_GRAPH_TYPE_CHOICES = (
+    ("", "Select primary graph type (optional)"),
+    ("bar_chart", "Bar Chart"),
+    ("line_graph", "Line Graph"),
+    ("pie_chart", "Pie Chart"),
+    ("scatter_plot", "Scatter Plot"),
+    ("histogram", "Histogram"),
+    ("box_plot", "Box Plot"),
+    ("mixed", "Multiple Graph Types"),
+    ("other", "Other Graph Type"),
+)
 
 
 class LoginForm(FlaskForm):
-    username = StringField("Email", validators=[DataRequired()])
-    password = PasswordField("Password", validators=[DataRequired()])
+    username = StringField("Email", validators=_REQUIRED)
+    password = PasswordField("Password", validators=_REQUIRED)
     submit = SubmitField("Login")
 
 
 class ObserverLoginForm(FlaskForm):
     # Kept for backward compatibility with legacy route which now redirects
-    email = StringField("Email", validators=[DataRequired(), Email()])
-    password = PasswordField("Password", validators=[DataRequired()])
+    email = StringField("Email", validators=_REQUIRED_EMAIL)
+    password = PasswordField("Password", validators=_REQUIRED)
     submit = SubmitField("Login")
 
 
 class UserCreationForm(FlaskForm):
-    username = StringField("Username", validators=[DataRequired()])
-    email = StringField("Email", validators=[DataRequired(), Email()])
-    first_name = StringField("First Name", validators=[DataRequired()])
-    last_name = StringField("Last Name", validators=[DataRequired()])
-    password = PasswordField("Password", validators=[DataRequired()])
-    role = SelectField(
-        "Role",
-        choices=[(role.value, role.value.title()) for role in User.Role],
-        default="teacher",
-    )
+    username = StringField("Username", validators=_REQUIRED)
+    email = StringField("Email", validators=_REQUIRED_EMAIL)
+    first_name = StringField("First Name", validators=_REQUIRED)
+    last_name = StringField("Last Name", validators=_REQUIRED)
+    password = PasswordField("Password", validators=_REQUIRED)
+    role = SelectField("Role", choices=_ROLE_CHOICES, default="teacher")
+    # Teacher/observer placement; a name creates the school or district if needed
+    school_id = IntegerField("School", validators=_OPTIONAL_ID)
+    district_id = IntegerField("District", validators=_OPTIONAL_ID)
+    school = StringField("School Name", filters=(_strip,))
+    district = StringField("District Name", filters=(_strip,))
     submit = SubmitField("Create User")
 
 
 class UserEditForm(FlaskForm):
-    username = StringField("Username", validators=[DataRequired()])
-    email = StringField("Email", validators=[DataRequired(), Email()])
-    first_name = StringField("First Name", validators=[DataRequired()])
-    last_name = StringField("Last Name", validators=[DataRequired()])
+    username = StringField("Username", validators=_REQUIRED)
+    email = StringField("Email", validators=_REQUIRED_EMAIL)
+    first_name = StringField("First Name", validators=_REQUIRED)
+    last_name = StringField("Last Name", validators=_REQUIRED)
     password = PasswordField("Password")  # Optional for editing
-    role = SelectField(
-        "Role", choices=[(role.value, role.value.title()) for role in User.Role]
-    )
+    role = SelectField("Role", choices=_ROLE_CHOICES)
     submit = SubmitField("Save Changes")
 
 
 class PasswordChangeForm(FlaskForm):
-    current_password = PasswordField("Current Password", validators=[DataRequired()])
-    new_password = PasswordField("New Password", validators=[DataRequired()])
+    current_password = PasswordField("Current Password", validators=_REQUIRED)
+    new_password = PasswordField("New Password", validators=_REQUIRED)
     confirm_password = PasswordField(
         "Confirm New Password",
         validators=[
@@ -83,7 +146,7 @@ class PasswordChangeForm(FlaskForm):
 class StartSessionForm(FlaskForm):
     name = StringField(
         "Session Name",
-        validators=[DataRequired()],
+        validators=_REQUIRED,
         render_kw={"placeholder": "e.g., Period 3 - Data Analysis"},
     )
     section = IntegerField(
@@ -96,19 +159,14 @@ class StartSessionForm(FlaskForm):
     )
     module = SelectField(
         "Module",
-        validators=[DataRequired()],
+        validators=_REQUIRED,
         choices=[],  # Will be populated dynamically
         coerce=int,  # Convert string values to integers
     )
     character_set = SelectField(
         "Character Set",
-        validators=[DataRequired()],
-        choices=[
-            ("animals", "Animals"),
-            ("superheroes", "Superheroes"),
-            ("fantasy", "Fantasy Characters"),
-            ("space", "Space Explorers"),
-        ],
+        validators=_REQUIRED,
+        choices=_CHARACTER_SET_CHOICES,
         default="animals",
     )
     student_count = IntegerField(
@@ -128,7 +186,7 @@ class StartSessionForm(FlaskForm):
     def __init__(self, *args, **kwargs):
         super(StartSessionForm, self).__init__(*args, **kwargs)
         # Populate module choices from database
-        self.module.choices = Module.get_choices_for_form()
+        self.module.choices = get_module_choices()
 
 
 class StudentLoginForm(FlaskForm):
@@ -136,7 +194,7 @@ class StudentLoginForm(FlaskForm):
     school_id = SelectField("School", coerce=int, choices=[])
     pin = PasswordField(
         "6-digit password",
-        validators=[DataRequired()],
+        validators=_REQUIRED,
         render_kw={
             "placeholder": "000000",
             "inputmode": "numeric",
@@ -148,16 +206,10 @@ class StudentLoginForm(FlaskForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Populate districts
-        districts = District.query.order_by(District.name).all()
-        self.district_id.choices = [(0, "Select District")] + [
-            (d.id, d.name) for d in districts
-        ]
-        # Initial schools (will be updated in route on selection)
-        schools = School.query.order_by(School.name).all()
-        self.school_id.choices = [(0, "Select School")] + [
-            (s.id, s.name) for s in schools
-        ]
+        # Populate districts and initial schools (schools are narrowed in the
+        # route on selection); both lists come from the in-process cache
+        self.district_id.choices = get_district_choices()
+        self.school_id.choices = get_school_choices()
 
 
 class ModuleForm(FlaskForm):
@@ -165,7 +217,7 @@ class ModuleForm(FlaskForm):
 
     name = StringField(
         "Module Name",
-        validators=[DataRequired()],
+        validators=_REQUIRED,
         render_kw={"placeholder": "e.g., Module 3 - Advanced Statistics"},
     )
     description = StringField(
@@ -180,7 +232,7 @@ class ModuleForm(FlaskForm):
     )
     is_active = SelectField(
         "Status",
-        choices=[(True, "Active"), (False, "Inactive")],
+        choices=_MODULE_STATUS_CHOICES,
         coerce=lambda x: x == "True",
         default=True,
     )
@@ -192,40 +244,32 @@ class SessionFilterForm(FlaskForm):
 
     status = SelectField(
         "Status",
-        choices=[
-            ("", "All Statuses"),
-            ("active", "Active"),
-            ("archived", "Archived"),
-            ("paused", "Paused"),
-        ],
-        validators=[Optional()],
+        choices=_SESSION_STATUS_CHOICES,
+        validators=_OPTIONAL,
         default="",
     )
 
     module = SelectField(
         "Module",
         choices=[("", "All Modules")],  # Will be populated dynamically
-        validators=[Optional()],
+        validators=_OPTIONAL,
         coerce=lambda x: int(x) if x else None,
         default="",
     )
 
     date_from = DateField(
-        "From Date", validators=[Optional()], render_kw={"placeholder": "Start date"}
+        "From Date", validators=_OPTIONAL, render_kw={"placeholder": "Start date"}
     )
 
     date_to = DateField(
-        "To Date", validators=[Optional()], render_kw={"placeholder": "End date"}
+        "To Date", validators=_OPTIONAL, render_kw={"placeholder": "End date"}
     )
 
     submit = SubmitField("Apply Filters")
 
     def populate_module_choices(self):
-        """Populate module choices from database."""
-        modules = Module.query.filter_by(is_active=True).order_by(Module.name).all()
-        choices = [("", "All Modules")]
-        choices.extend([(module.id, module.name) for module in modules])
-        self.module.choices = choices
+        """Populate module choices from the shared active-module cache."""
+        self.module.choices = [("", "All Modules")] + get_module_choices()
 
 
 class MediaFilterForm(FlaskForm):
@@ -233,48 +277,36 @@ class MediaFilterForm(FlaskForm):
 
     media_type = SelectField(
         "Media Type",
-        choices=[
-            ("", "All Types"),
-            ("image", "Images"),
-            ("video", "Videos"),
-        ],
-        validators=[Optional()],
+        choices=_MEDIA_TYPE_FILTER_CHOICES,
+        validators=_OPTIONAL,
         default="",
     )
 
     graph_tag = SelectField(
         "Graph Tag",
         choices=[("", "All Graph Tags")],  # Will be populated dynamically
-        validators=[Optional()],
+        validators=_OPTIONAL,
         default="",
     )
 
     variable_tag = SelectField(
         "Variable Tag",
         choices=[("", "All Variable Tags")],  # Will be populated dynamically
-        validators=[Optional()],
+        validators=_OPTIONAL,
         default="",
     )
 
     is_graph = SelectField(
         "Graph Content",
-        choices=[
-            ("", "All Content"),
-            ("true", "Graph Content Only"),
-            ("false", "Non-Graph Content Only"),
-        ],
-        validators=[Optional()],
+        choices=_IS_GRAPH_FILTER_CHOICES,
+        validators=_OPTIONAL,
         default="",
     )
 
     posted_by = SelectField(
         "Posted By",
-        choices=[
-            ("", "All Authors"),
-            ("students", "Students"),
-            ("teacher", "Teacher"),
-        ],
-        validators=[Optional()],
+        choices=_POSTED_BY_FILTER_CHOICES,
+        validators=_OPTIONAL,
         default="",
     )
 
@@ -284,38 +316,22 @@ class MediaFilterForm(FlaskForm):
         """Populate graph_tag and variable_tag choices from session media."""
         from models import Media
 
-        # Get unique graph tags from this session's media
-        graph_tags = (
-            db.session.query(Media.graph_tag)
-            .filter(
-                Media.session_id == session_id,
-                Media.graph_tag.isnot(None),
-                Media.graph_tag != "",
-            )
+        # One scan of this session's media yields both tag columns
+        rows = db.session.execute(
+            select(Media.graph_tag, Media.variable_tag)
+            .where(Media.session_id == session_id)
             .distinct()
-            .all()
-        )
-
-        # Get unique variable tags from this session's media
-        variable_tags = (
-            db.session.query(Media.variable_tag)
-            .filter(
-                Media.session_id == session_id,
-                Media.variable_tag.isnot(None),
-                Media.variable_tag != "",
-            )
-            .distinct()
-            .all()
-        )
+        ).all()
+        graph_tags = {row.graph_tag for row in rows if row.graph_tag}
+        variable_tags = {row.variable_tag for row in rows if row.variable_tag}
 
         # Update choices
-        graph_choices = [("", "All Graph Tags")]
-        graph_choices.extend([(tag[0], tag[0]) for tag in graph_tags])
-        self.graph_tag.choices = graph_choices
-
-        variable_choices = [("", "All Variable Tags")]
-        variable_choices.extend([(tag[0], tag[0]) for tag in variable_tags])
-        self.variable_tag.choices = variable_choices
+        self.graph_tag.choices = [("", "All Graph Tags")] + [
+            (tag, tag) for tag in sorted(graph_tags)
+        ]
+        self.variable_tag.choices = [("", "All Variable Tags")] + [
+            (tag, tag) for tag in sorted(variable_tags)
+        ]
 
 
 class SingleMediaUploadForm(FlaskForm):
@@ -349,17 +365,8 @@ class SingleMediaUploadForm(FlaskForm):
 
     graph_tag = SelectField(
         "Graph Type",
-        choices=[
-            ("", "Select graph type (optional)"),
-            ("bar_chart", "Bar Chart"),
-            ("line_graph", "Line Graph"),
-            ("pie_chart", "Pie Chart"),
-            ("scatter_plot", "Scatter Plot"),
-            ("histogram", "Histogram"),
-            ("box_plot", "Box Plot"),
-            ("other", "Other Graph Type"),
-        ],
-        validators=[Optional()],
+        choices=_GRAPH_TYPE_CHOICES,
+        validators=_OPTIONAL,
     )
 
     variable_tag = StringField(
@@ -402,18 +409,8 @@ class ProjectGalleryUploadForm(FlaskForm):
 
     graph_tag = SelectField(
         "Primary Graph Type",
-        choices=[
-            ("", "Select primary graph type (optional)"),
-            ("bar_chart", "Bar Chart"),
-            ("line_graph", "Line Graph"),
-            ("pie_chart", "Pie Chart"),
-            ("scatter_plot", "Scatter Plot"),
-            ("histogram", "Histogram"),
-            ("box_plot", "Box Plot"),
-            ("mixed", "Multiple Graph Types"),
-            ("other", "Other Graph Type"),
-        ],
-        validators=[Optional()],
+        choices=_PROJECT_GRAPH_TYPE_CHOICES,
+        validators=_OPTIONAL,
     )
 
     variable_tag = StringField(
@@ -438,17 +435,8 @@ class MediaEditForm(FlaskForm):
 
     graph_tag = SelectField(
         "Graph Type",
-        choices=[
-            ("", "Select graph type (optional)"),
-            ("bar_chart", "Bar Chart"),
-            ("line_graph", "Line Graph"),
-            ("pie_chart", "Pie Chart"),
-            ("scatter_plot", "Scatter Plot"),
-            ("histogram", "Histogram"),
-            ("box_plot", "Box Plot"),
-            ("other", "Other Graph Type"),
-        ],
-        validators=[Optional()],
+        choices=_GRAPH_TYPE_CHOICES,
+        validators=_OPTIONAL,
     )
 
     variable_tag = StringField(
@@ -469,7 +457,7 @@ class CommentForm(FlaskForm):
     )
     parent_id = IntegerField(
         "Reply To",
-        validators=[Optional()],
+        validators=_OPTIONAL,
         render_kw={"type": "hidden"},
     )
     submit = SubmitField("Post Comment")
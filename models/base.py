@@ -1,21 +1,49 @@
 from datetime import datetime, timezone
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import postgresql, sqlite
 
 db = SQLAlchemy()
 
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def upsert_insert(table):
+    """Return an INSERT for ``table`` that supports ``on_conflict_do_*``.
+
+    Picks the construct for the bound database's dialect; raises
+    NotImplementedError on dialects without ON CONFLICT support.
+    """
+    dialect = db.session.get_bind().dialect.name
+    insert = _UPSERT_INSERTS.get(dialect)
+    if insert is None:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return insert(table)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
 
 class BaseModel(db.Model):
     __abstract__ = True
 
     id = db.Column(db.Integer, primary_key=True)
+    # Python-side UTC timestamps keep microsecond precision and differ per row
+    # (SQL now() is per-second on SQLite and per-transaction on PostgreSQL,
+    # which would tie every row of a batch). The server_default only covers
+    # raw SQL inserts that leave the columns out.
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        db.DateTime,
+        default=_utcnow,
+        server_default=db.func.now(),
+        nullable=False,
     )
     updated_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=_utcnow,
+        server_default=db.func.now(),
+        onupdate=_utcnow,
         nullable=False,
     )
 
@@ -14,12 +14,35 @@ class Comment(BaseModel):
     admin_avatar = db.Column(db.String(256))
 
     # Relationships
-    media = db.relationship(
-        "Media", foreign_keys=[media_id], backref=db.backref("comments", lazy="dynamic")
-    )
-    # Use a lambda to avoid Python built-in `id` and ensure proper late-binding
+    media = db.relationship("Media", backref=db.backref("comments", lazy="dynamic"))
+    # String form avoids the built-in `id` and resolves once at configure time
     parent = db.relationship(
         "Comment",
-        remote_side=lambda: [Comment.id],
+        remote_side="Comment.id",
         backref=db.backref("replies", lazy="dynamic"),
     )
+
+    @classmethod
+    def tree_for_media(cls, media_id):
+        """Return a media item's top-level comments with replies nested.
+
+        Every comment carries ``media_id``, so one query fetches the whole
+        thread. Replies are attached as ``nested_replies``, a plain attribute, so
+        the ``replies`` relationship is neither loaded nor modified.
+        """
+        comments = (
+            cls.query.filter_by(media_id=media_id)
+            .order_by(cls.created_at.asc(), cls.id.asc())
+            .all()
+        )
+        by_id = {comment.id: comment for comment in comments}
+        for comment in comments:
+            comment.nested_replies = []
+
+        tree = []
+        for comment in comments:
+            if comment.parent_id is None:
+                tree.append(comment)
+            elif comment.parent_id in by_id:
+                by_id[comment.parent_id].nested_replies.append(comment)
+        return tree
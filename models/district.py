@@ -1,4 +1,4 @@
-from .base import BaseModel, db
+from .base import BaseModel, db, upsert_insert
 
 
 class District(BaseModel):
@@ -11,5 +11,18 @@ class District(BaseModel):
     schools = db.relationship("School", back_populates="district", lazy="dynamic")
     users = db.relationship("User", back_populates="district", lazy="dynamic")
 
+    @classmethod
+    def get_or_create_id(cls, name):
+        """Return the id of the district called ``name``, creating it if needed.
+
+        A single INSERT ... ON CONFLICT (name) statement, so concurrent admins
+        naming the same new district get the same row. Callers commit.
+        """
+        stmt = upsert_insert(cls.__table__).values(name=name)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"], set_={"name": stmt.excluded.name}
+        ).returning(cls.id)
+        return db.session.execute(stmt).scalar_one()
+
     def __repr__(self):
         return f"<District {self.name}>"
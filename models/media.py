@@ -39,13 +39,13 @@ class Media(BaseModel):
 
     # Project support
     project_group = db.Column(db.String(36))  # uuid string
-    project_images = db.Column(db.JSON)
+    # Only the post detail page reads the image list; keep it out of list queries
+    project_images = db.deferred(db.Column(db.JSON))
     is_project = db.Column(db.Boolean, nullable=False, default=False)
 
     # Relationships
     session = db.relationship(
         "Session",
-        foreign_keys=[session_id],
         backref=db.backref(
             "media",
             lazy="dynamic",
@@ -58,7 +58,7 @@ class Media(BaseModel):
         foreign_keys=[student_id],
         backref=db.backref("media", lazy="dynamic"),
     )
-    posted_by_admin = db.relationship("User", foreign_keys=[posted_by_admin_id])
+    posted_by_admin = db.relationship("User")
 
     def ensure_project_group(self):
         if self.is_project and not self.project_group:
@@ -69,4 +69,21 @@ class Media(BaseModel):
         db.Index("ix_media_media_type", "media_type"),
         db.Index("ix_media_graph_tag", "graph_tag"),
         db.Index("ix_media_variable_tag", "variable_tag"),
+        # Covers the per-session tag filter choices lookup
+        db.Index("ix_media_session_tags", "session_id", "graph_tag", "variable_tag"),
+        # Partial indexes; predicates mirror the ORM filters so planners match them
+        db.Index(
+            "ix_media_graphs_only",
+            "session_id",
+            "uploaded_at",
+            sqlite_where=is_graph.is_(True),
+            postgresql_where=is_graph.is_(True),
+        ),
+        db.Index(
+            "ix_media_projects_only",
+            "project_group",
+            "uploaded_at",
+            sqlite_where=is_project == True,  # noqa: E712
+            postgresql_where=is_project == True,  # noqa: E712
+        ),
     )
@@ -1,3 +1,5 @@
+from sqlalchemy import select, update
+
 from .base import BaseModel, db
 
 
@@ -22,6 +24,11 @@ class Module(BaseModel):
         status = "Active" if self.is_active else "Inactive"
         return f"<Module {self.name} ({status})>"
 
+    @property
+    def display_name(self):
+        """Label used by the session templates."""
+        return self.name
+
     @classmethod
     def get_active_modules(cls):
         """Get all active modules ordered by sort_order, then name."""
@@ -33,9 +40,17 @@ class Module(BaseModel):
 
     @classmethod
     def get_choices_for_form(cls):
-        """Get (id, name) tuples for form SelectField choices."""
-        modules = cls.get_active_modules()
-        return [(module.id, module.name) for module in modules]
+        """Get (id, name) tuples for form SelectField choices.
+
+        Forms use the cached ``services.module_choices.get_module_choices``.
+        """
+        # Only the two columns are needed, so skip ORM hydration
+        rows = db.session.execute(
+            select(cls.id, cls.name)
+            .where(cls.is_active.is_(True))
+            .order_by(cls.sort_order.asc(), cls.name.asc())
+        )
+        return [(row.id, row.name) for row in rows]
 
     def activate(self):
         """Mark module as active."""
@@ -45,4 +60,20 @@ class Module(BaseModel):
         """Mark module as inactive."""
         self.is_active = False
 
+    @classmethod
+    def toggle_active(cls, module_id):
+        """Flip is_active with one UPDATE ... RETURNING; callers commit.
+
+        Returns the module's ``(name, is_active)`` row after the flip, or None if
+        there is no such module. The UPDATE skips mapper events, so callers also
+        clear the cached module choices.
+        """
+        row = db.session.execute(
+            update(cls)
+            .where(cls.id == module_id)
+            .values(is_active=~cls.is_active)
+            .returning(cls.name, cls.is_active)
+        ).one_or_none()
+        return row
+
     __table_args__ = (db.Index("ix_modules_active_sort", "is_active", "sort_order"),)
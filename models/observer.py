@@ -1,3 +1,5 @@
+from sqlalchemy import update
+
 from .base import db
 from .user import User
 
@@ -15,7 +17,23 @@ class Observer(User):
         "polymorphic_identity": "observer",
         # Disambiguate joined-table inheritance when multiple FKs target users.id
         "inherit_condition": id == User.id,
+        # Load subclass columns for mixed User queries in one batched SELECT
+        "polymorphic_load": "selectin",
     }
 
     # Creator relationship (typically an admin/teacher who invited the observer)
     created_by = db.relationship("User", foreign_keys=[created_by_id])
+
+    @classmethod
+    def toggle_active(cls, user_id):
+        """Flip is_active with one UPDATE ... RETURNING; callers commit.
+
+        Returns the observer's ``(is_active,)`` row after the flip, or None if
+        ``user_id`` is not an observer.
+        """
+        return db.session.execute(
+            update(cls)
+            .where(cls.id == user_id)
+            .values(is_active=~cls.is_active)
+            .returning(cls.is_active)
+        ).one_or_none()
@@ -10,7 +10,9 @@ class Session(BaseModel):
     original_name = db.Column(db.String(128))
     session_code = db.Column(db.String(8), unique=True, nullable=False)
     section = db.Column(db.Integer, nullable=False)
-    module_id = db.Column(db.Integer, db.ForeignKey("modules.id"), nullable=False)
+    module_id = db.Column(
+        db.Integer, db.ForeignKey("modules.id"), nullable=False, index=True
+    )
     is_paused = db.Column(db.Boolean, nullable=False, default=False)
     is_archived = db.Column(db.Boolean, nullable=False, default=False)
     archived_at = db.Column(db.DateTime)
@@ -20,14 +22,15 @@ class Session(BaseModel):
     created_by_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
 
     # Relationships
-    created_by = db.relationship("User", foreign_keys=[created_by_id])
+    created_by = db.relationship("User")
     module = db.relationship("Module", back_populates="sessions")
 
     # Helper methods
     def archive(self):
         if not self.is_archived:
             self.is_archived = True
-            self.archived_at = datetime.now(timezone.utc)
+            # Naive UTC, matching what the naive DateTime columns load back
+            self.archived_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
     @classmethod
     def find_active_conflict(cls, teacher_id, section, exclude_session_id=None):
@@ -35,15 +38,17 @@ class Session(BaseModel):
         query = cls.query.filter(
             cls.created_by_id == teacher_id,
             cls.section == section,
-            cls.is_archived == False,  # noqa: E712
+            cls.is_archived.is_(False),
         )
         if exclude_session_id:
             query = query.filter(cls.id != exclude_session_id)
         return query.first()
 
     def __repr__(self):
-        module_name = self.module.name if self.module else "Unknown Module"
-        return f"<Session {self.name} " f"(Section {self.section}, {module_name})>"
+        # Only use an already-loaded module; repr must not trigger a query
+        module = self.__dict__.get("module")
+        module_name = module.name if module else f"module_id={self.module_id}"
+        return f"<Session {self.name} (Section {self.section}, {module_name})>"
 
     __table_args__ = (
         db.Index(
@@ -13,13 +13,17 @@ class Student(User):
     section_id = db.Column(db.Integer, db.ForeignKey("sessions.id"))
     device_id = db.Column(db.String(128))
     pin_hash = db.Column(db.String(128))
-    current_pin = db.Column(db.String(6))  # Plain text PIN for teacher viewing
+    # Plain text PIN for teacher viewing; indexed so student login can narrow
+    # candidates before running the slow hash check
+    current_pin = db.Column(db.String(6), index=True)
 
     # Use polymorphic identity to distinguish Student from User
     __mapper_args__ = {
         "polymorphic_identity": "student",
         # Disambiguate joined-table inheritance when multiple FKs target users.id
         "inherit_condition": id == User.id,
+        # Load subclass columns for mixed User queries in one batched SELECT
+        "polymorphic_load": "selectin",
     }
 
     # Relationship to teacher
@@ -32,7 +36,6 @@ class Student(User):
     # Relationship to session/section
     section = db.relationship(
         "Session",
-        foreign_keys=[section_id],
         backref=db.backref("students", lazy="dynamic", cascade="all, delete-orphan"),
     )
 
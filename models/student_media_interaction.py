@@ -1,4 +1,4 @@
-from .base import BaseModel, db
+from .base import BaseModel, _utcnow, db, upsert_insert
 
 
 class StudentMediaInteraction(BaseModel):
@@ -11,18 +11,52 @@ class StudentMediaInteraction(BaseModel):
     liked_read = db.Column(db.Boolean, nullable=False, default=False)
     comment_count = db.Column(db.Integer, nullable=False, default=0)
 
-    # Relationships
+    # Relationships. The reverse collections are only loaded when a student or
+    # media item is deleted, so that its interactions are deleted with it.
     student = db.relationship(
         "Student",
-        foreign_keys=[student_id],
-        backref=db.backref("interactions", lazy="dynamic"),
+        backref=db.backref("interactions", cascade="all, delete-orphan"),
     )
     media = db.relationship(
         "Media",
-        foreign_keys=[media_id],
-        backref=db.backref("interactions", lazy="dynamic"),
+        backref=db.backref("interactions", cascade="all, delete-orphan"),
     )
 
+    @classmethod
+    def bulk_upsert(cls, rows):
+        """Insert or update many interactions in a single statement.
+
+        ``rows`` are dicts with the same keys: ``student_id``, ``media_id`` and any
+        of the reaction/comment columns. On a (student_id, media_id) conflict those
+        columns are overwritten. Use this instead of one ORM object per like
+        when writing interactions in bulk. Callers commit.
+        """
+        if not rows:
+            return
+        stmt = upsert_insert(cls.__table__)
+        updated = {key for row in rows for key in row} - {"student_id", "media_id"}
+        set_ = {key: stmt.excluded[key] for key in updated}
+        # Same Python clock as the ORM onupdate, not the database's now()
+        set_["updated_at"] = _utcnow()
+        db.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["student_id", "media_id"], set_=set_
+            ),
+            rows,
+        )
+
     __table_args__ = (
         db.UniqueConstraint("student_id", "media_id", name="uq_student_media"),
+        # Reverse lookup by media; covers the reaction flags on PostgreSQL
+        db.Index(
+            "ix_smi_media_student",
+            "media_id",
+            "student_id",
+            postgresql_include=[
+                "liked_graph",
+                "liked_eye",
+                "liked_read",
+                "comment_count",
+            ],
+        ),
     )
@@ -28,9 +28,14 @@ class User(BaseModel, UserMixin):
     last_name = db.Column(db.String(64))
     role = db.Column(db.Enum(Role), nullable=False, default=Role.STUDENT)
 
-    # Foreign keys for school and district
-    school_id = db.Column(db.Integer, db.ForeignKey("schools.id"), nullable=True)
-    district_id = db.Column(db.Integer, db.ForeignKey("districts.id"), nullable=True)
+    # Foreign keys for school and district, indexed for the per-school and
+    # per-district user lookups and counts
+    school_id = db.Column(
+        db.Integer, db.ForeignKey("schools.id"), nullable=True, index=True
+    )
+    district_id = db.Column(
+        db.Integer, db.ForeignKey("districts.id"), nullable=True, index=True
+    )
 
     # Relationships
     school = db.relationship("School", back_populates="users")
@@ -52,14 +57,19 @@ class User(BaseModel, UserMixin):
     def is_student(self):
         return self.role == self.Role.STUDENT
 
+    def is_admin_or_staff(self):
+        return self.role in ADMIN_ROLES
+
     def requires_school_info(self):
         """Check if the user role requires school and district information"""
-        return self.role in [self.Role.TEACHER, self.Role.OBSERVER]
+        return self.role in _SCHOOL_INFO_ROLES
 
     def validate(self):
         """Validate user data based on role; raise ValueError if invalid."""
         if self.requires_school_info():
-            if not (self.school_id and self.district_id):
+            # A school may be assigned as a not-yet-flushed object
+            has_school = self.school_id or self.school is not None
+            if not (has_school and self.district_id):
                 raise ValueError(
                     "Teachers and Observers must have both school and district assigned"
                 )
@@ -67,3 +77,13 @@ class User(BaseModel, UserMixin):
 
     def __repr__(self):
         return f"<User {self.username} ({self.role.value})>"
+
+
+# Serves the admin dashboard's newest-first user listing (ORDER BY created_at
+# DESC LIMIT n). Declared outside the class so joined-table subclasses such as
+# Observer don't inherit it through __table_args__.
+db.Index("ix_users_created_at", User.created_at)
+
+# Role groups checked on hot paths (admin_required, validation)
+ADMIN_ROLES = frozenset({User.Role.ADMIN, User.Role.STAFF})
+_SCHOOL_INFO_ROLES = frozenset({User.Role.TEACHER, User.Role.OBSERVER})
@@ -10,15 +10,21 @@ from .profile import bp as profile_bp
 from .sessions import bp as sessions_bp
 from .students import bp as students_bp
 
+# Registration order is preserved; blueprints are built once at import time
+_BLUEPRINTS = (
+    auth_bp,
+    main_bp,
+    admin_bp,
+    profile_bp,
+    sessions_bp,
+    students_bp,
+    media_bp,
+    posts_bp,
+    errors_bp,
+)
+
 
 def init_app(app: Flask):
     """Initialize all blueprints with the app"""
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(main_bp)
-    app.register_blueprint(admin_bp)
-    app.register_blueprint(profile_bp)
-    app.register_blueprint(sessions_bp)
-    app.register_blueprint(students_bp)
-    app.register_blueprint(media_bp)
-    app.register_blueprint(posts_bp)
-    app.register_blueprint(errors_bp)
+    for blueprint in _BLUEPRINTS:
+        app.register_blueprint(blueprint)
@@ -1,7 +1,21 @@
+from collections import Counter
 from functools import wraps
 
-from flask import flash, jsonify, redirect, render_template, request, url_for
+from flask import (
+    abort,
+    current_app,
+    flash,
+    g,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 from flask_login import current_user, login_required
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload, selectinload
 from werkzeug.security import generate_password_hash
 
 from forms import ModuleForm, UserCreationForm
@@ -10,44 +24,91 @@ from models.district import District
 from models.module import Module
 from models.observer import Observer
 from models.school import School
-from models.user import User
+from models.session import Session
+from models.user import ADMIN_ROLES, User
+from services.dashboard_counts import clear_dashboard_counts_cache, get_user_counts
+from services.dashboard_lists import clear_dashboard_lists_cache, get_dashboard_lists
+from services.login_choices import clear_login_choices_cache
+from services.module_choices import clear_module_choices_cache
 
 from .base import create_blueprint
 
 bp = create_blueprint("admin")
 
 
+def _is_admin_or_staff():
+    """Whether the current user may use admin views, computed once per request."""
+    if "is_admin_or_staff" not in g:
+        # Anonymous users have no role; one set lookup covers admin and staff
+        g.is_admin_or_staff = getattr(current_user, "role", None) in ADMIN_ROLES
+    return g.is_admin_or_staff
+
+
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not (
-            current_user.is_admin() or current_user.is_staff()
-        ):
+        if not _is_admin_or_staff():
             return render_template("errors/403.html"), 403
         return f(*args, **kwargs)
 
     return decorated_function
 
 
+def _dashboard_counts(schools):
+    """Per-district and per-school counts for the dashboard tables.
+
+    User counts come from one cached grouped query rather than a ``.count()``
+    per district and school row; school counts per district come from the
+    already loaded ``schools`` list.
+    """
+    district_users, school_users = get_user_counts()
+    return {
+        "district_schools": Counter(s.district_id for s in schools),
+        "district_users": district_users,
+        "school_users": school_users,
+    }
+
+
+def _user_list_query():
+    """Dashboard users with the relationships the template reads.
+
+    With STRICT_LOADING any other relationship access on these users raises,
+    so a template change that would lazy-load per row fails the tests.
+    """
+    options = [selectinload(User.school), selectinload(User.district)]
+    if current_app.config["STRICT_LOADING"]:
+        options.append(raiseload("*"))
+    # id breaks created_at ties so OFFSET pages never repeat or skip a user
+    return (
+        select(User).options(*options).order_by(User.created_at.desc(), User.id.desc())
+    )
+
+
 @bp.route("/admin", methods=["GET"])
 @login_required
 @admin_required
 def admin_dashboard():
-    form = UserCreationForm()
-    module_form = ModuleForm()
-    users = User.query.order_by(User.created_at.desc()).all()
-    schools = School.query.all()
-    districts = District.query.all()
-    modules = Module.query.order_by(Module.sort_order.asc(), Module.name.asc()).all()
+    # The create-user form is only rendered for admins
+    form = UserCreationForm() if current_user.is_admin() else None
+    page = request.args.get("page", 1, type=int)
+    per_page = 50  # Users per page
+    users_pagination = db.paginate(
+        _user_list_query(),
+        page=page,
+        per_page=per_page,
+        error_out=False,
+    )
+    # Dropdowns and tables only read these columns; cached between visits
+    schools, districts = get_dashboard_lists()
     return render_template(
         "admin/dashboard.html",
         form=form,
-        module_form=module_form,
         roles=User.Role,
-        users=users,
+        users=users_pagination.items,
+        users_pagination=users_pagination,
         schools=schools,
         districts=districts,
-        modules=modules,
+        counts=_dashboard_counts(schools),
     )
 
 
@@ -59,74 +120,88 @@ def create_user():
         flash("Only administrators can create new users.", "danger")
         return redirect(url_for("admin.admin_dashboard"))
 
+    form = UserCreationForm()
+    if not form.validate_on_submit():
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(f"{field}: {error}", "danger")
+        return redirect(url_for("admin.admin_dashboard"))
+
+    # Cheap indexed lookup first, so a duplicate submit never pays for hashing
+    taken = db.session.execute(
+        select(User.username, User.email)
+        .where(or_(User.username == form.username.data, User.email == form.email.data))
+        .limit(2)
+    ).all()
+    if any(row.username == form.username.data for row in taken):
+        flash(f"Username '{form.username.data}' is already taken.", "danger")
+        return redirect(url_for("admin.admin_dashboard"))
+    if taken:
+        flash(f"Email '{form.email.data}' is already in use.", "danger")
+        return redirect(url_for("admin.admin_dashboard"))
+
     try:
-        role_value = request.form["role"]
-        is_observer = role_value == User.Role.OBSERVER.value
+        role = User.Role(form.role.data)
         base_kwargs = {
-            "username": request.form["username"],
-            "email": request.form["email"],
-            "password_hash": generate_password_hash(request.form["password"]),
-            "first_name": request.form["first_name"],
-            "last_name": request.form["last_name"],
-            "role": User.Role(role_value),
+            "username": form.username.data,
+            "email": form.email.data,
+            "password_hash": generate_password_hash(form.password.data),
+            "first_name": form.first_name.data,
+            "last_name": form.last_name.data,
+            "role": role,
         }
 
         # Create correct subclass for observer accounts so observer login works
-        new_user = Observer(**base_kwargs) if is_observer else User(**base_kwargs)
+        if role is User.Role.OBSERVER:
+            new_user = Observer(**base_kwargs)
+        else:
+            new_user = User(**base_kwargs)
 
+        district_upserted = False
         # Handle school/district info for teachers/observers (only use IDs now)
         if new_user.requires_school_info():
-            school_id_str = request.form.get("school_id", "").strip()
-            district_id_str = request.form.get("district_id", "").strip()
-            school_name = request.form.get("school", "").strip()
-            district_name = request.form.get("district", "").strip()
+            school_name = form.school.data
+            district_name = form.district.data
 
             # Set school_id (prefer ID, but create school if name provided)
-            if school_id_str:
-                try:
-                    new_user.school_id = int(school_id_str)
-                except ValueError:
-                    flash("Invalid school ID provided.", "danger")
-                    return redirect(url_for("admin.admin_dashboard"))
+            if form.school_id.data is not None:
+                new_user.school_id = form.school_id.data
             elif school_name:
                 # Find or create school by name
-                school = School.query.filter_by(name=school_name).first()
-                if not school:
+                school_id = db.session.scalar(
+                    select(School.id).where(School.name == school_name).limit(1)
+                )
+                if school_id is None:
                     # Need district first for school creation
-                    if not district_id_str and not district_name:
+                    if form.district_id.data is None and not district_name:
                         flash(
                             "District is required when creating a new school.", "danger"
                         )
                         return redirect(url_for("admin.admin_dashboard"))
                     # Will set school after district is resolved
                 else:
-                    new_user.school_id = school.id
+                    new_user.school_id = school_id
 
             # Set district_id (prefer ID, but create district if name provided)
-            if district_id_str:
-                try:
-                    new_user.district_id = int(district_id_str)
-                except ValueError:
-                    flash("Invalid district ID provided.", "danger")
-                    return redirect(url_for("admin.admin_dashboard"))
+            if form.district_id.data is not None:
+                new_user.district_id = form.district_id.data
             elif district_name:
                 # Find or create district by name
-                district = District.query.filter_by(name=district_name).first()
-                if not district:
-                    district = District(name=district_name)
-                    db.session.add(district)
-                    db.session.flush()  # Get ID
-                new_user.district_id = district.id
-
-                # Now create school if needed
+                new_user.district_id = District.get_or_create_id(district_name)
+                district_upserted = True
+
+                # Now create school if needed; it is inserted with the user
                 if school_name and not new_user.school_id:
-                    school = School(name=school_name, district_id=district.id)
-                    db.session.add(school)
-                    db.session.flush()  # Get ID
-                    new_user.school_id = school.id
+                    new_user.school = School(
+                        name=school_name, district_id=new_user.district_id
+                    )
         new_user.validate()
         db.session.add(new_user)
         db.session.commit()
+        if district_upserted:
+            # The district upsert is Core SQL and skips the District listeners
+            clear_login_choices_cache()
+            clear_dashboard_lists_cache()
         flash("User created successfully!", "success")
     except ValueError as e:
         flash(str(e), "danger")
@@ -141,83 +216,74 @@ def create_user():
 @login_required
 @admin_required
 def edit_user(user_id):
-    user = User.query.get_or_404(user_id)
-    if request.method == "POST":
-        try:
-            user.username = request.form["username"]
-            user.email = request.form["email"]
-            user.first_name = request.form["first_name"]
-            user.last_name = request.form["last_name"]
-
-            # Only allow admin to change roles
-            if current_user.is_admin():
-                user.role = User.Role(request.form["role"])
-
-            if request.form.get("password"):
-                user.password_hash = generate_password_hash(request.form["password"])
-
-            # Handle school and district for teachers/observers
-            if user.requires_school_info():
-                school_id_str = request.form.get("school_id", "").strip()
-                district_id_str = request.form.get("district_id", "").strip()
-
-                # Set school_id (convert empty string to None)
-                if school_id_str:
-                    try:
-                        user.school_id = int(school_id_str)
-                    except ValueError:
-                        return (
-                            jsonify({"success": False, "message": "Invalid school ID"}),
-                            400,
-                        )
-                else:
-                    user.school_id = None
-
-                # Set district_id (convert empty string to None)
-                if district_id_str:
-                    try:
-                        user.district_id = int(district_id_str)
-                    except ValueError:
-                        return (
-                            jsonify(
-                                {"success": False, "message": "Invalid district ID"}
-                            ),
-                            400,
-                        )
-                else:
-                    user.district_id = None
+    if request.method == "GET":
+        # Read-only: select just the form fields, no User/subclass instance
+        row = db.session.execute(
+            select(
+                User.username,
+                User.email,
+                User.first_name,
+                User.last_name,
+                User.role,
+                User.school_id,
+                User.district_id,
+            ).where(User.id == user_id)
+        ).one_or_none()
+        if row is None:
+            abort(404)
+        return jsonify({**row._asdict(), "role": row.role.value})
+
+    user = db.get_or_404(User, user_id)
+    try:
+        user.username = request.form["username"]
+        user.email = request.form["email"]
+        user.first_name = request.form["first_name"]
+        user.last_name = request.form["last_name"]
 
-            # Validate will raise ValueError on failure
-            user.validate()
+        # Only allow admin to change roles
+        if current_user.is_admin():
+            user.role = User.Role(request.form["role"])
 
-            db.session.commit()
-            return jsonify({"success": True, "message": "User updated successfully!"})
-        except ValueError as e:
-            return jsonify({"success": False, "message": str(e)}), 400
-        except Exception:
-            db.session.rollback()
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "message": "Error updating user. Please try again.",
-                    }
-                ),
-                500,
-            )
+        if request.form.get("password"):
+            user.password_hash = generate_password_hash(request.form["password"])
 
-    # GET request - return user data
-    return jsonify(
-        {
-            "username": user.username,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "role": user.role.value,
-            "school_id": user.school_id,
-            "district_id": user.district_id,
-        }
-    )
+        # Handle school and district for teachers/observers
+        if user.requires_school_info():
+            school_id_str = request.form.get("school_id", "").strip()
+            district_id_str = request.form.get("district_id", "").strip()
+
+            # Empty clears the assignment; anything else must be all digits
+            if school_id_str and not school_id_str.isdecimal():
+                return (
+                    jsonify({"success": False, "message": "Invalid school ID"}),
+                    400,
+                )
+            if district_id_str and not district_id_str.isdecimal():
+                return (
+                    jsonify({"success": False, "message": "Invalid district ID"}),
+                    400,
+                )
+            user.school_id = int(school_id_str) if school_id_str else None
+            user.district_id = int(district_id_str) if district_id_str else None
+
+        # Validate will raise ValueError on failure
+        user.validate()
+
+        db.session.commit()
+        return jsonify({"success": True, "message": "User updated successfully!"})
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception:
+        db.session.rollback()
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": "Error updating user. Please try again.",
+                }
+            ),
+            500,
+        )
 
 
 @bp.route("/admin/delete_user/<int:user_id>", methods=["POST"])
@@ -238,7 +304,7 @@ def delete_user(user_id):
             400,
         )
 
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     try:
         db.session.delete(user)
         db.session.commit()
@@ -261,12 +327,6 @@ def create_module():
 
     if form.validate_on_submit():
         try:
-            # Check if module name already exists
-            existing_module = Module.query.filter_by(name=form.name.data).first()
-            if existing_module:
-                flash(f"Module '{form.name.data}' already exists.", "danger")
-                return redirect(url_for("admin.admin_dashboard"))
-
             module = Module(
                 name=form.name.data,
                 description=form.description.data,
@@ -278,6 +338,10 @@ def create_module():
             db.session.commit()
             flash(f"Module '{module.name}' created successfully!", "success")
 
+        except IntegrityError:
+            # modules.name is unique; the constraint is the duplicate check
+            db.session.rollback()
+            flash(f"Module '{form.name.data}' already exists.", "danger")
         except Exception as e:
             db.session.rollback()
             flash(f"Error creating module: {e}", "danger")
@@ -294,19 +358,10 @@ def create_module():
 @admin_required
 def edit_module(module_id):
     """Edit an existing curriculum module."""
-    module = Module.query.get_or_404(module_id)
+    module = db.get_or_404(Module, module_id)
 
+    new_name = request.form.get("name", "").strip()
     try:
-        # Check if new name conflicts with existing module (excluding current one)
-        new_name = request.form.get("name", "").strip()
-        if new_name and new_name != module.name:
-            existing_module = Module.query.filter(
-                Module.name == new_name, Module.id != module_id
-            ).first()
-            if existing_module:
-                flash(f"Module name '{new_name}' already exists.", "danger")
-                return redirect(url_for("admin.admin_dashboard"))
-
         # Update fields
         if new_name:
             module.name = new_name
@@ -326,6 +381,9 @@ def edit_module(module_id):
         db.session.commit()
         flash(f"Module '{module.name}' updated successfully!", "success")
 
+    except IntegrityError:
+        db.session.rollback()
+        flash(f"Module name '{new_name}' already exists.", "danger")
     except Exception as e:
         db.session.rollback()
         flash(f"Error updating module: {e}", "danger")
@@ -338,14 +396,17 @@ def edit_module(module_id):
 @admin_required
 def toggle_module(module_id):
     """Toggle module active/inactive status."""
-    module = Module.query.get_or_404(module_id)
+    row = Module.toggle_active(module_id)
+    if row is None:
+        abort(404)
 
     try:
-        module.is_active = not module.is_active
         db.session.commit()
+        # The bulk UPDATE skips the mapper events that clear the cached choices
+        clear_module_choices_cache()
 
-        status = "activated" if module.is_active else "deactivated"
-        flash(f"Module '{module.name}' {status} successfully!", "success")
+        status = "activated" if row.is_active else "deactivated"
+        flash(f"Module '{row.name}' {status} successfully!", "success")
 
     except Exception as e:
         db.session.rollback()
@@ -359,15 +420,17 @@ def toggle_module(module_id):
 @admin_required
 def delete_module(module_id):
     """Delete a curriculum module (only if no sessions use it)."""
-    module = Module.query.get_or_404(module_id)
+    module = db.get_or_404(Module, module_id)
 
     try:
         # Check if any sessions use this module
-        from models.session import Session
-
-        session_count = Session.query.filter_by(module_id=module_id).count()
+        in_use = db.session.scalar(
+            select(Session.id).filter_by(module_id=module_id).exists().select()
+        )
 
-        if session_count > 0:
+        if in_use:
+            # Only a refused delete needs the number for the message
+            session_count = Session.query.filter_by(module_id=module_id).count()
             return (
                 jsonify(
                     {
@@ -407,17 +470,20 @@ def create_district():
         return redirect(url_for("admin.admin_dashboard"))
 
     try:
-        if District.query.filter_by(name=name).first():
-            flash(f"District '{name}' already exists.", "danger")
-            return redirect(url_for("admin.admin_dashboard"))
-        if code and District.query.filter_by(code=code).first():
-            flash(f"District code '{code}' already exists.", "danger")
-            return redirect(url_for("admin.admin_dashboard"))
-
         d = District(name=name, code=code)
         db.session.add(d)
         db.session.commit()
         flash(f"District '{name}' created.", "success")
+    except IntegrityError:
+        # name and code are unique; the constraints are the duplicate checks
+        db.session.rollback()
+        name_taken = db.session.scalar(
+            select(District.id).where(District.name == name).limit(1)
+        )
+        if name_taken:
+            flash(f"District '{name}' already exists.", "danger")
+        else:
+            flash(f"District code '{code}' already exists.", "danger")
     except Exception as e:
         db.session.rollback()
         flash(f"Error creating district: {e}", "danger")
@@ -428,7 +494,7 @@ def create_district():
 @login_required
 @admin_required
 def get_district(district_id: int):
-    d = District.query.get_or_404(district_id)
+    d = db.get_or_404(District, district_id)
     return jsonify({"id": d.id, "name": d.name, "code": d.code})
 
 
@@ -436,26 +502,34 @@ def get_district(district_id: int):
 @login_required
 @admin_required
 def edit_district(district_id: int):
-    d = District.query.get_or_404(district_id)
+    d = db.get_or_404(District, district_id)
     name = request.form.get("name", "").strip()
     code = request.form.get("code", "").strip() or None
     try:
-        if name and name != d.name:
-            if District.query.filter(
-                District.name == name, District.id != d.id
-            ).first():
+        new_name = name if name and name != d.name else None
+        new_code = code if code and code != d.code else None
+        clashes = []
+        if new_name:
+            clashes.append(District.name == new_name)
+        if new_code:
+            clashes.append(District.code == new_code)
+        if clashes:
+            # Both uniqueness checks in one query; name and code are each
+            # unique, so at most two other districts can match
+            taken = db.session.execute(
+                select(District.name, District.code)
+                .where(District.id != d.id, or_(*clashes))
+                .limit(2)
+            ).all()
+            if new_name and any(row.name == new_name for row in taken):
                 flash(f"Another district already uses the name '{name}'.", "danger")
                 return redirect(url_for("admin.admin_dashboard"))
-            d.name = name
-        if (code or code is None) and code != d.code:
-            if (
-                code
-                and District.query.filter(
-                    District.code == code, District.id != d.id
-                ).first()
-            ):
+            if new_code and any(row.code == new_code for row in taken):
                 flash(f"Another district already uses the code '{code}'.", "danger")
                 return redirect(url_for("admin.admin_dashboard"))
+        if new_name:
+            d.name = new_name
+        if code != d.code:
             d.code = code
         db.session.commit()
         flash("District updated successfully.", "success")
@@ -479,9 +553,16 @@ def delete_district(district_id: int):
             ),
             403,
         )
-    d = District.query.get_or_404(district_id)
+    d = db.get_or_404(District, district_id)
     try:
-        if d.schools.count() > 0 or d.users.count() > 0:
+        # One round trip; each EXISTS stops at the first matching row
+        has_children = db.session.scalar(
+            select(
+                select(School.id).filter_by(district_id=d.id).exists()
+                | select(User.id).filter_by(district_id=d.id).exists()
+            )
+        )
+        if has_children:
             return (
                 jsonify(
                     {
@@ -522,14 +603,21 @@ def create_school():
         return redirect(url_for("admin.admin_dashboard"))
 
     try:
-        if code and School.query.filter_by(code=code).first():
-            flash(f"School code '{code}' already exists.", "danger")
-            return redirect(url_for("admin.admin_dashboard"))
-
         s = School(name=name, code=code, district_id=district_id)
         db.session.add(s)
         db.session.commit()
         flash(f"School '{name}' created.", "success")
+    except IntegrityError as e:
+        # schools.code is unique; the constraint is the duplicate check. The
+        # district foreign key can also fail here where it is enforced.
+        db.session.rollback()
+        code_taken = code and db.session.scalar(
+            select(School.id).where(School.code == code).limit(1)
+        )
+        if code_taken:
+            flash(f"School code '{code}' already exists.", "danger")
+        else:
+            flash(f"Error creating school: {e}", "danger")
     except Exception as e:
         db.session.rollback()
         flash(f"Error creating school: {e}", "danger")
@@ -540,7 +628,7 @@ def create_school():
 @login_required
 @admin_required
 def get_school(school_id: int):
-    s = School.query.get_or_404(school_id)
+    s = db.get_or_404(School, school_id)
     return jsonify(
         {"id": s.id, "name": s.name, "code": s.code, "district_id": s.district_id}
     )
@@ -550,7 +638,7 @@ def get_school(school_id: int):
 @login_required
 @admin_required
 def edit_school(school_id: int):
-    s = School.query.get_or_404(school_id)
+    s = db.get_or_404(School, school_id)
     name = request.form.get("name", "").strip()
     code = request.form.get("code", "").strip() or None
     try:
@@ -571,7 +659,7 @@ def edit_school(school_id: int):
             s.code = code
         if district_id and district_id != s.district_id:
             # Ensure district exists
-            if not District.query.get(district_id):
+            if not db.session.get(District, district_id):
                 flash("Invalid district.", "danger")
                 return redirect(url_for("admin.admin_dashboard"))
             s.district_id = district_id
@@ -594,9 +682,12 @@ def delete_school(school_id: int):
             ),
             403,
         )
-    s = School.query.get_or_404(school_id)
+    s = db.get_or_404(School, school_id)
     try:
-        if s.users.count() > 0:
+        has_users = db.session.scalar(
+            select(User.id).filter_by(school_id=s.id).exists().select()
+        )
+        if has_users:
             return (
                 jsonify(
                     {
@@ -625,14 +716,14 @@ def delete_school(school_id: int):
 @login_required
 @admin_required
 def toggle_observer(user_id: int):
-    user = User.query.get_or_404(user_id)
-    if not isinstance(user, Observer):
+    row = Observer.toggle_active(user_id)
+    if row is None:
+        db.get_or_404(User, user_id)
         flash("Selected user is not an observer.", "danger")
         return redirect(url_for("admin.admin_dashboard"))
     try:
-        user.is_active = not bool(user.is_active)
         db.session.commit()
-        status = "activated" if user.is_active else "deactivated"
+        status = "activated" if row.is_active else "deactivated"
         flash(f"Observer {status} successfully.", "success")
     except Exception as e:
         db.session.rollback()
@@ -647,7 +738,7 @@ def reset_observer_password(user_id: int):
     if not current_user.is_admin():
         flash("Only administrators can reset passwords.", "danger")
         return redirect(url_for("admin.admin_dashboard"))
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     if not isinstance(user, Observer):
         flash("Selected user is not an observer.", "danger")
         return redirect(url_for("admin.admin_dashboard"))
@@ -669,33 +760,45 @@ def reset_observer_password(user_id: int):
 @login_required
 @admin_required
 def assign_observer_district(user_id: int):
-    user = User.query.get_or_404(user_id)
+    try:
+        district_id = int(request.form.get("district_id", "0"))
+    except ValueError:
+        district_id = 0
+    if district_id:
+        # One UPDATE when the observer and district both exist; the lookups
+        # below only run to explain a miss
+        try:
+            assigned = db.session.execute(
+                update(User)
+                .where(
+                    User.id == user_id,
+                    User.type == Observer.__mapper__.polymorphic_identity,
+                    select(District.id).where(District.id == district_id).exists(),
+                )
+                .values(district_id=district_id)
+                .returning(User.id)
+            ).first()
+            if assigned:
+                db.session.commit()
+                # Bulk UPDATEs skip the User write listener
+                clear_dashboard_counts_cache()
+                return jsonify({"success": True})
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"success": False, "message": str(e)}), 500
+
+    user = db.get_or_404(User, user_id)
     if not isinstance(user, Observer):
         return (
             jsonify({"success": False, "message": "Selected user is not an observer."}),
             400,
         )
-    try:
-        district_id = int(request.form.get("district_id", "0"))
-    except ValueError:
-        district_id = 0
     if not district_id:
         return (
             jsonify({"success": False, "message": "District is required."}),
             400,
         )
-    try:
-        if not District.query.get(district_id):
-            return (
-                jsonify({"success": False, "message": "Invalid district."}),
-                400,
-            )
-        user.district_id = district_id
-        db.session.commit()
-        return jsonify({"success": True})
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"success": False, "message": str(e)}), 500
+    return jsonify({"success": False, "message": "Invalid district."}), 400
 
 
 # -------------------- Teacher Reassignment --------------------
@@ -706,7 +809,7 @@ def assign_observer_district(user_id: int):
 @admin_required
 def assign_teacher(user_id: int):
     """Assign or reassign a teacher's district and school."""
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     if not user.is_teacher():
         return (
             jsonify({"success": False, "message": "Selected user is not a teacher."}),
@@ -728,15 +831,19 @@ def assign_teacher(user_id: int):
     # Validate
     if district_id is None:
         return jsonify({"success": False, "message": "District is required."}), 400
-    district = District.query.get(district_id)
-    if not district:
+    # One query answers "does the district exist" and "where is the school"
+    row = db.session.execute(
+        select(District.id, School.id.label("school_id"), School.district_id)
+        .outerjoin(School, School.id == school_id)
+        .where(District.id == district_id)
+    ).first()
+    if row is None:
         return jsonify({"success": False, "message": "District not found."}), 404
 
     if school_id is not None:
-        school = School.query.get(school_id)
-        if not school:
+        if row.school_id is None:
             return jsonify({"success": False, "message": "School not found."}), 404
-        if school.district_id != district_id:
+        if row.district_id != district_id:
             return (
                 jsonify(
                     {
@@ -1,5 +1,6 @@
 from flask import flash, redirect, render_template, url_for
 from flask_login import current_user, login_user, logout_user
+from sqlalchemy import or_
 from werkzeug.security import check_password_hash
 
 from forms import LoginForm
@@ -15,11 +16,14 @@ bp = create_blueprint("auth")
 def login():
     form = LoginForm()
     if form.validate_on_submit():
-        # Primary: treat form value as email; Fallback: username
+        # Primary: treat form value as email; Fallback: username. One query;
+        # an email match wins over another account with that username
         value = form.username.data
-        user = User.query.filter_by(email=value).first()
-        if not user:
-            user = User.query.filter_by(username=value).first()
+        user = (
+            User.query.filter(or_(User.email == value, User.username == value))
+            .order_by((User.email == value).desc())
+            .first()
+        )
         if user and check_password_hash(user.password_hash, form.password.data):
             # All users now use Flask-Login (unified authentication)
             login_user(user)
@@ -28,7 +32,7 @@ def login():
             # Role-based redirect after login
             if user.is_observer():
                 return redirect(url_for("main.observer_dashboard"))
-            elif user.is_admin() or user.is_staff():
+            elif user.is_admin_or_staff():
                 return redirect(url_for("admin.admin_dashboard"))
             else:
                 return redirect(url_for("main.index"))
@@ -1,5 +1,15 @@
-from flask import flash, redirect, render_template, request, session, url_for
+from flask import (
+    current_app,
+    flash,
+    redirect,
+    render_template,
+    request,
+    session,
+    url_for,
+)
 from flask_login import current_user, login_required
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import raiseload, selectinload
 from werkzeug.security import check_password_hash
 
 from forms import StudentLoginForm
@@ -7,12 +17,22 @@ from models import Media, Session, User, db
 from models.district import District
 from models.school import School
 from models.student import Student
+from services.login_choices import get_school_choices
 
 from .base import create_blueprint, student_required
 
 bp = create_blueprint("main")
 
 
+def _strict_loading():
+    """Loader options that make any other lazy load raise under STRICT_LOADING.
+
+    Observer pages list rows whose templates only read the eager-loaded data,
+    so a template change that would lazy-load per row fails the tests.
+    """
+    return [raiseload("*")] if current_app.config["STRICT_LOADING"] else []
+
+
 @bp.route("/")
 def index():
     # Check if this is a student session
@@ -27,6 +47,17 @@ def index():
     return render_template("index.html")
 
 
+def _match_student_pin(query, pin):
+    """Return the first row of ``query`` whose PIN (or password) hash matches."""
+    # Stream in batches so a match stops the fetch early; the with block
+    # closes the cursor on that early return
+    with db.session.execute(query.execution_options(yield_per=100)) as rows:
+        for row in rows:
+            if check_password_hash(row.pin_hash or row.password_hash, pin):
+                return row
+    return None
+
+
 @bp.route("/student/login", methods=["GET", "POST"])
 def student_login():
     form = StudentLoginForm()
@@ -37,31 +68,36 @@ def student_login():
         district_id = form.district_id.data or request.args.get("district", type=int)
         school_id = form.school_id.data or request.args.get("school", type=int)
 
-        query = Student.query
+        # Try students showing this PIN first, so the slow hash check usually
+        # runs once per login rather than once per student in scope. The hash
+        # alone decides, so the rest of the scope is still checked when
+        # current_pin is missing or out of step with pin_hash.
+        scope = select(
+            Student.id,
+            Student.username,
+            Student.character_name,
+            Student.pin_hash,
+            Student.password_hash,
+        )
         if district_id:
-            query = query.filter(
-                Student.district_id == district_id
-            )  # inherited from User
+            scope = scope.where(Student.district_id == district_id)
         if school_id:
-            query = query.filter(Student.school_id == school_id)
-
-        # Iterate candidates; at classroom scale this is small
-        for s in query.all():
-            if check_password_hash(s.pin_hash or s.password_hash, pin):
-                session["student_id"] = s.id
-                flash("Welcome, {}".format(s.character_name or s.username), "success")
-                return redirect(url_for("main.index"))
+            scope = scope.where(Student.school_id == school_id)
+        student = _match_student_pin(scope.where(Student.current_pin == pin), pin)
+        if student is None:
+            others = or_(Student.current_pin.is_(None), Student.current_pin != pin)
+            student = _match_student_pin(scope.where(others), pin)
+        if student:
+            session["student_id"] = student.id
+            flash(
+                "Welcome, {}".format(student.character_name or student.username),
+                "success",
+            )
+            return redirect(url_for("main.index"))
         flash("Invalid student password.", "danger")
     # Filter schools dropdown when district is chosen
     if form.district_id.data and form.district_id.data != 0:
-        schools = (
-            School.query.filter_by(district_id=form.district_id.data)
-            .order_by(School.name)
-            .all()
-        )
-        form.school_id.choices = [(0, "Select School")] + [
-            (s.id, s.name) for s in schools
-        ]
+        form.school_id.choices = get_school_choices(form.district_id.data)
     return render_template("student_login.html", form=form)
 
 
@@ -100,22 +136,27 @@ def observer_dashboard():
                 .all()
             )
 
-            # Stats: teachers in district
-            teachers_q = User.query.filter(
+            # Stats: teachers in district and the sessions they created, both
+            # counted in one round trip over the same teacher id subquery
+            teacher_ids = select(User.id).where(
                 User.role == User.Role.TEACHER, User.district_id == district.id
             )
-            stats["teachers"] = teachers_q.count()
-
-            # Sessions created by those teachers
-            teacher_ids = [t.id for t in teachers_q]
-            if teacher_ids:
-                stats["sessions"] = Session.query.filter(
-                    Session.created_by_id.in_(teacher_ids)
-                ).count()
+            stats["teachers"], stats["sessions"] = db.session.execute(
+                select(
+                    select(func.count())
+                    .select_from(teacher_ids.subquery())
+                    .scalar_subquery(),
+                    select(func.count(Session.id))
+                    .where(Session.created_by_id.in_(teacher_ids))
+                    .scalar_subquery(),
+                )
+            ).one()
+            if stats["sessions"]:
                 # Recent media across the district (limit 12)
                 stats["recent_media"] = (
                     Media.query.join(Session, Media.session_id == Session.id)
                     .filter(Session.created_by_id.in_(teacher_ids))
+                    .options(*_strict_loading())
                     .order_by(Media.uploaded_at.desc())
                     .limit(12)
                     .all()
@@ -146,16 +187,18 @@ def observer_teacher(teacher_id: int):
     if not current_user.district_id or teacher.district_id != current_user.district_id:
         return render_template("errors/403.html"), 403
 
-    # Sessions and basic stats
+    # Sessions and basic stats; the list shows each session's module
     sessions = (
         Session.query.filter_by(created_by_id=teacher.id)
+        .options(selectinload(Session.module), *_strict_loading())
         .order_by(Session.created_at.desc())
         .all()
     )
-    # Recent media for teacher
+    # Recent media for teacher (the tiles only read Media columns)
     recent_media = (
         Media.query.join(Session, Media.session_id == Session.id)
         .filter(Session.created_by_id == teacher.id)
+        .options(*_strict_loading())
         .order_by(Media.uploaded_at.desc())
         .limit(12)
         .all()
@@ -189,29 +232,38 @@ def observer_school(school_id: int):
         # Forbidden: school not in observer's district
         return render_template("errors/403.html"), 403
 
-    teachers = (
-        User.query.filter(
-            User.role == User.Role.TEACHER,
-            User.school_id == school.id,
-        )
+    # The list only shows these columns; plain rows skip ORM loading
+    teachers = db.session.execute(
+        select(User.id, User.first_name, User.last_name, User.email)
+        .where(User.role == User.Role.TEACHER, User.school_id == school.id)
         .order_by(User.last_name, User.first_name)
-        .all()
+    ).all()
+
+    # Build simple stats per teacher: one grouped count per stat, not two
+    # queries per teacher
+    teacher_ids = [t.id for t in teachers]
+    session_counts = dict(
+        db.session.execute(
+            select(Session.created_by_id, func.count(Session.id))
+            .where(Session.created_by_id.in_(teacher_ids))
+            .group_by(Session.created_by_id)
+        ).all()
     )
-
-    # Build simple stats per teacher
-    teacher_stats = {}
-    for t in teachers:
-        sessions = Session.query.filter_by(created_by_id=t.id)
-        sessions_count = sessions.count()
-        recent_media_count = (
-            Media.query.join(Session, Media.session_id == Session.id)
-            .filter(Session.created_by_id == t.id)
-            .count()
-        )
-        teacher_stats[t.id] = {
-            "sessions": sessions_count,
-            "recent_media": recent_media_count,
+    media_counts = dict(
+        db.session.execute(
+            select(Session.created_by_id, func.count(Media.id))
+            .join(Media, Media.session_id == Session.id)
+            .where(Session.created_by_id.in_(teacher_ids))
+            .group_by(Session.created_by_id)
+        ).all()
+    )
+    teacher_stats = {
+        t.id: {
+            "sessions": session_counts.get(t.id, 0),
+            "recent_media": media_counts.get(t.id, 0),
         }
+        for t in teachers
+    }
 
     return render_template(
         "observer/school_detail.html",
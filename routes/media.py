@@ -198,15 +198,8 @@ def media_detail(media_id):
     if media.is_project and media.project_group:
         project_images = MediaService.get_project_gallery(media.project_group)
 
-    # Get comments for this media item
-    comments = (
-        Comment.query.filter_by(media_id=media_id)
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
-
-    # Build nested comment structure
-    comment_tree = _build_comment_tree(comments)
+    # Get comments for this media item with replies nested under parents
+    comment_tree = Comment.tree_for_media(media_id)
 
     # Get interaction info
     interaction_info = _get_interaction_info(media)
@@ -493,27 +486,6 @@ def add_comment(media_id):
     return redirect(url_for("media.media_detail", media_id=media_id))
 
 
-def _build_comment_tree(comments):
-    """Build a nested structure for comments and replies."""
-    comment_dict = {comment.id: comment for comment in comments}
-    tree = []
-
-    for comment in comments:
-        # Add a replies list to each comment (use a different attribute name
-        # to avoid SQLAlchemy conflict)
-        comment.nested_replies = []
-
-        if comment.parent_id is None:
-            # Top-level comment
-            tree.append(comment)
-        else:
-            # Reply - add to parent's replies
-            if comment.parent_id in comment_dict:
-                comment_dict[comment.parent_id].nested_replies.append(comment)
-
-    return tree
-
-
 def _get_interaction_info(media):
     """Get interaction counts and current user's interactions."""
     info = {
@@ -6,6 +6,7 @@ Posts are essentially media items with comment threads.
 
 from flask import current_app, flash, redirect, render_template, session, url_for
 from flask_login import current_user
+from sqlalchemy.orm import undefer
 
 from forms import CommentForm
 from models import Comment, Media, Student, StudentMediaInteraction, User, db
@@ -19,7 +20,7 @@ bp = create_blueprint("posts")
 @teacher_or_student_required
 def post_detail(media_id):
     """View post detail with media, poster info, and comment thread."""
-    media = Media.query.get_or_404(media_id)
+    media = Media.query.options(undefer(Media.project_images)).get_or_404(media_id)
 
     # Check access permissions
     if current_user.is_authenticated:
@@ -36,16 +37,8 @@ def post_detail(media_id):
                 flash("You can only view posts from your session.", "warning")
                 return redirect(url_for("main.index"))
 
-    # Get all comments for this media, ordered by creation time
-    # We'll handle nesting in the template
-    comments = (
-        Comment.query.filter_by(media_id=media_id)
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
-
-    # Build nested comment structure
-    comment_tree = _build_comment_tree(comments)
+    # Get comments for this media item with replies nested under parents
+    comment_tree = Comment.tree_for_media(media_id)
 
     # Get poster information
     poster_info = _get_poster_info(media)
@@ -132,26 +125,6 @@ def add_comment(media_id):
     return redirect(url_for("posts.post_detail", media_id=media_id))
 
 
-def _build_comment_tree(comments):
-    """Build a nested structure for comments and replies."""
-    comment_dict = {comment.id: comment for comment in comments}
-    tree = []
-
-    for comment in comments:
-        # Add a replies list to each comment
-        comment.replies = []
-
-        if comment.parent_id is None:
-            # Top-level comment
-            tree.append(comment)
-        else:
-            # Reply - add to parent's replies
-            if comment.parent_id in comment_dict:
-                comment_dict[comment.parent_id].replies.append(comment)
-
-    return tree
-
-
 def _get_poster_info(media):
     """Get information about who posted the media."""
     if media.student_id:
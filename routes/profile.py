@@ -27,7 +27,7 @@ def profile():
             flash("Current password is incorrect.", "danger")
 
     # Choose template based on user role
-    if current_user.is_admin() or current_user.is_staff():
+    if current_user.is_admin_or_staff():
         template = "profile/admin_staff_profile.html"
     elif current_user.is_teacher():
         template = "profile/teacher_profile.html"
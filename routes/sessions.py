@@ -17,9 +17,7 @@ bp = create_blueprint("sessions")
 @login_required
 def start_session():
     """Start a new session with conflict detection and resolution."""
-    if not (
-        current_user.is_teacher() or current_user.is_admin() or current_user.is_staff()
-    ):
+    if not (current_user.is_teacher() or current_user.is_admin_or_staff()):
         flash("Only teachers can create sessions.", "danger")
         return redirect(url_for("main.index"))
 
@@ -94,8 +92,6 @@ def session_detail(session_id):
         # Student access - check if they belong to this session
         student_id = session.get("student_id")
         if student_id:
-            from models import Student
-
             student = Student.query.get(student_id)
             if not student or student.section_id != session_id:
                 flash("You can only access your assigned session.", "warning")
@@ -472,7 +468,7 @@ def list_sessions():
     # Build base query based on user role
     if current_user.is_teacher():
         query = Session.query.filter_by(created_by_id=current_user.id)
-    elif current_user.is_admin() or current_user.is_staff():
+    elif current_user.is_admin_or_staff():
         query = Session.query
     else:
         flash("Access denied.", "danger")
@@ -15,6 +15,8 @@ from flask_login import current_user, login_required
 
 from models import db
 from models.media import Media
+from models.session import Session
+from models.student_media_interaction import StudentMediaInteraction
 from services.pin_cards_service import PinCardsService
 from services.student_service import StudentService
 
@@ -43,8 +45,6 @@ def student_list():
     # Get session info if filtering by session
     session = None
     if session_id:
-        from models.session import Session
-
         session = Session.query.filter(
             Session.id == session_id, Session.created_by_id == current_user.id
         ).first()
@@ -335,10 +335,6 @@ def detailed_analytics():
         return jsonify({"success": False, "message": "Access denied"}), 403
 
     try:
-
-        from models.media import Media
-        from models.session import Session
-
         # Get all students for this teacher
         students = StudentService.get_students_for_teacher(current_user.id)
         student_ids = [s.id for s in students]
@@ -375,8 +371,6 @@ def detailed_analytics():
             uploads = Media.query.filter(Media.student_id == student.id).count()
 
             # Get reactions given by this student
-            from models.student_media_interaction import StudentMediaInteraction
-
             interactions = StudentMediaInteraction.query.filter(
                 StudentMediaInteraction.student_id == student.id
             ).all()
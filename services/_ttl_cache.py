@@ -0,0 +1,55 @@
+"""
+Process-local TTL cache for read-mostly lookups.
+Entries expire after a fixed number of seconds, so other worker processes pick
+up changes, and are dropped as soon as a watched model is written through the
+ORM in this process.
+"""
+
+import functools
+import time
+
+from sqlalchemy import event
+
+from models.base import db
+
+_WRITE_EVENTS = ("after_insert", "after_update", "after_delete")
+
+
+def database_key(*args):
+    """Cache key of the loader's arguments plus the current database URL."""
+    return (str(db.engine.url), *args)
+
+
+def cached(key_fn, ttl, invalidate_on=()):
+    """Reuse a loader's result for ``ttl`` seconds per ``key_fn(*args)``.
+
+    The wrapped loader gains ``cache_clear()``, which is also registered as the
+    insert/update/delete listener of every model in ``invalidate_on`` (with
+    ``propagate=True`` so subclass writes count). Writes that bypass the ORM,
+    such as Core or bulk UPDATEs, must call it themselves.
+    """
+
+    def decorate(loader):
+        entries = {}
+
+        @functools.wraps(loader)
+        def wrapper(*args):
+            key = key_fn(*args)
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            value = loader(*args)
+            entries[key] = (now, value)
+            return value
+
+        def cache_clear(*_args):
+            entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        for model in invalidate_on:
+            for event_name in _WRITE_EVENTS:
+                event.listen(model, event_name, cache_clear, propagate=True)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,38 @@
+"""
+Cached per-district and per-school user counts for the admin dashboard.
+Every dashboard visit shows these counts, but users only change through sign-ups
+and the admin screens.
+"""
+
+from collections import Counter
+
+from sqlalchemy import func, select
+
+from models import User, db
+from services._ttl_cache import cached, database_key
+
+COUNTS_TTL_SECONDS = 30
+
+
+@cached(database_key, COUNTS_TTL_SECONDS, invalidate_on=(User,))
+def get_user_counts():
+    """Return ``(district_users, school_users)`` Counters keyed by id.
+
+    The Counters are shared between callers and must not be modified.
+    """
+    district_users = Counter()
+    school_users = Counter()
+    rows = db.session.execute(
+        select(User.district_id, User.school_id, func.count(User.id)).group_by(
+            User.district_id, User.school_id
+        )
+    )
+    for district_id, school_id, total in rows:
+        if district_id is not None:
+            district_users[district_id] += total
+        if school_id is not None:
+            school_users[school_id] += total
+    return district_users, school_users
+
+
+clear_dashboard_counts_cache = get_user_counts.cache_clear
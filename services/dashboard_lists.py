@@ -0,0 +1,39 @@
+"""
+Cached school and district table rows for the admin dashboard.
+Every dashboard visit lists all schools and districts, while they change only
+through the admin screens.
+"""
+
+from sqlalchemy import select
+
+from models import District, School, db
+from services._ttl_cache import cached, database_key
+
+LISTS_TTL_SECONDS = 30
+
+
+@cached(database_key, LISTS_TTL_SECONDS, invalidate_on=(District, School))
+def get_dashboard_lists():
+    """Return ``(schools, districts)`` as tuples of read-only column rows.
+
+    School rows carry ``id, name, code, district_id, district_name``; district
+    rows carry ``id, name, code``.
+    """
+    schools = tuple(
+        db.session.execute(
+            select(
+                School.id,
+                School.name,
+                School.code,
+                School.district_id,
+                District.name.label("district_name"),
+            ).join(School.district)
+        )
+    )
+    districts = tuple(
+        db.session.execute(select(District.id, District.name, District.code))
+    )
+    return schools, districts
+
+
+clear_dashboard_lists_cache = get_dashboard_lists.cache_clear
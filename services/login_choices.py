@@ -0,0 +1,36 @@
+"""
+Cached District/School dropdown choices for the student login form.
+The login page is hit on every student sign-in, while districts and schools
+change only through the admin screens.
+"""
+
+from sqlalchemy import select
+
+from models import District, School, db
+from services._ttl_cache import cached, database_key
+
+CHOICES_TTL_SECONDS = 300
+
+
+@cached(database_key, CHOICES_TTL_SECONDS, invalidate_on=(District, School))
+def _choice_rows(model, district_id):
+    query = select(model.id, model.name).order_by(model.name)
+    if district_id is not None:
+        query = query.where(model.district_id == district_id)
+    return tuple((row.id, row.name) for row in db.session.execute(query))
+
+
+def get_district_choices():
+    """Return district SelectField choices, led by the placeholder option."""
+    return [(0, "Select District")] + list(_choice_rows(District, None))
+
+
+def get_school_choices(district_id=None):
+    """Return school SelectField choices, led by the placeholder option.
+
+    With ``district_id`` only that district's schools are listed.
+    """
+    return [(0, "Select School")] + list(_choice_rows(School, district_id))
+
+
+clear_login_choices_cache = _choice_rows.cache_clear
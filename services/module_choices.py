@@ -0,0 +1,25 @@
+"""
+Cached active-module choices for the session forms.
+Every session create/edit/filter form lists the active modules, while modules
+change only through the admin screens.
+"""
+
+from models import Module
+from services._ttl_cache import cached, database_key
+
+MODULE_CHOICES_TTL_SECONDS = 300
+
+
+@cached(database_key, MODULE_CHOICES_TTL_SECONDS, invalidate_on=(Module,))
+def _choice_rows():
+    return tuple(Module.get_choices_for_form())
+
+
+def get_module_choices():
+    """Return ``(id, name)`` SelectField choices for the active modules."""
+    return list(_choice_rows())
+
+
+# Dropped on every Module write; bulk UPDATEs such as Module.toggle_active
+# must be followed by a call to it
+clear_module_choices_cache = _choice_rows.cache_clear
@@ -1,12 +1,15 @@
 """
 Navigation session helpers for role-based session dropdowns.
 This module provides functions to fetch appropriate sessions for each user role.
+The nav bar renders on every page, so the teacher/observer/admin lists are
+returned as lightweight rows holding only the columns the dropdowns display.
 """
 
 from flask import session as flask_session
 from flask_login import current_user
+from sqlalchemy import select
 
-from models import School, Session, Student, User
+from models import District, Module, School, Session, Student, User, db
 
 
 def get_student_session():
@@ -27,93 +30,90 @@ def get_student_session():
 def get_teacher_sessions(limit=10):
     """
     Get active sessions for the current teacher.
-    Returns list of Session objects ordered by most recent.
+    Returns rows (id, name, section, module_name) ordered by most recent.
     """
     if not current_user.is_authenticated or not current_user.is_teacher():
         return []
 
-    return (
-        Session.query.filter(
+    return db.session.execute(
+        select(
+            Session.id,
+            Session.name,
+            Session.section,
+            Module.name.label("module_name"),
+        )
+        .outerjoin(Module, Session.module_id == Module.id)
+        .where(
             Session.created_by_id == current_user.id,
-            Session.is_archived == False,  # noqa: E712
+            Session.is_archived.is_(False),
         )
         .order_by(Session.created_at.desc())
         .limit(limit)
-        .all()
-    )
+    ).all()
 
 
 def get_observer_sessions(limit=20):
     """
     Get sessions visible to the current observer.
-    Observers see sessions from their district/school scope.
-    Returns list of Session objects grouped by school.
+    Observers see sessions from teachers in their district/school scope.
+    Returns rows (id, name, section, creator_first_name, creator_last_name).
     """
     if not current_user.is_authenticated or not current_user.is_observer():
         return []
 
-    # Observers see sessions from teachers in their school/district
-    teacher_ids = (
-        User.query.filter(
+    return db.session.execute(
+        select(
+            Session.id,
+            Session.name,
+            Session.section,
+            User.first_name.label("creator_first_name"),
+            User.last_name.label("creator_last_name"),
+        )
+        .join(User, Session.created_by_id == User.id)
+        .where(
             User.role == User.Role.TEACHER,
             User.school_id == current_user.school_id,
             User.district_id == current_user.district_id,
-        )
-        .with_entities(User.id)
-        .all()
-    )
-
-    teacher_ids = [t[0] for t in teacher_ids]
-
-    if not teacher_ids:
-        return []
-
-    return (
-        Session.query.filter(
-            Session.created_by_id.in_(teacher_ids),
-            Session.is_archived == False,  # noqa: E712
+            Session.is_archived.is_(False),
         )
         .order_by(Session.created_at.desc())
         .limit(limit)
-        .all()
-    )
+    ).all()
 
 
 def get_admin_sessions(limit=50):
     """
     Get sessions visible to admin/staff.
-    Admins see all sessions, optionally grouped by district/school.
-    Returns dict with structure: {district_name: {school_name: [sessions]}}
+    Admins see all sessions, grouped by the creator's district and school.
+    Returns dict with structure: {district_name: {school_name: [rows]}}, where
+    rows carry (id, name, creator_first_name, creator_last_name).
     """
-    if not current_user.is_authenticated or not (
-        current_user.is_admin() or current_user.is_staff()
-    ):
+    if not current_user.is_authenticated or not current_user.is_admin_or_staff():
         return {}
 
-    # Get all active sessions with their creator's school/district info
-    sessions = (
-        Session.query.join(User, Session.created_by_id == User.id)
+    # Active sessions with their creator's school/district names in one query
+    rows = db.session.execute(
+        select(
+            Session.id,
+            Session.name,
+            User.first_name.label("creator_first_name"),
+            User.last_name.label("creator_last_name"),
+            District.name.label("district_name"),
+            School.name.label("school_name"),
+        )
+        .join(User, Session.created_by_id == User.id)
         .join(School, User.school_id == School.id)
-        .filter(Session.is_archived == False)  # noqa: E712
+        .join(District, User.district_id == District.id)
+        .where(Session.is_archived.is_(False))
         .order_by(Session.created_at.desc())
         .limit(limit)
-        .all()
-    )
+    ).all()
 
     # Group by district -> school -> sessions
     grouped = {}
-    for session in sessions:
-        teacher = session.created_by
-        if teacher.district and teacher.school:
-            district_name = teacher.district.name
-            school_name = teacher.school.name
-
-            if district_name not in grouped:
-                grouped[district_name] = {}
-            if school_name not in grouped[district_name]:
-                grouped[district_name][school_name] = []
-
-            grouped[district_name][school_name].append(session)
+    for row in rows:
+        schools = grouped.setdefault(row.district_name, {})
+        schools.setdefault(row.school_name, []).append(row)
 
     return grouped
 
@@ -139,9 +139,7 @@ def get_nav_sessions_for_current_user():
         return {"type": "observer", "data": observer_sessions}
 
     # Admin/staff sessions
-    if current_user.is_authenticated and (
-        current_user.is_admin() or current_user.is_staff()
-    ):
+    if current_user.is_authenticated and current_user.is_admin_or_staff():
         admin_sessions = get_admin_sessions()
         return {"type": "admin", "data": admin_sessions}
 
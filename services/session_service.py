@@ -3,6 +3,7 @@ import string
 from typing import Optional, Tuple
 
 from flask import flash
+from werkzeug.security import generate_password_hash
 
 from models import Session, Student, User, db
 
@@ -147,8 +148,6 @@ class SessionService:
             - Character themes: animals, superheroes, fantasy, space
             - Falls back to generic names if unique name generation fails
         """
-        from werkzeug.security import generate_password_hash
-
         students = []
         used_names = set()
         used_pins = set()
@@ -248,14 +247,17 @@ class SessionService:
             username = f"student_{session.session_code}_{i:02d}".lower()
             email = f"{username}@datadeck.local"
 
+            # Hashing is deliberately slow; both credentials share one hash
+            pin_hash = generate_password_hash(pin)
             student = Student(
                 username=username,
                 email=email,
-                password_hash=generate_password_hash(pin),
+                password_hash=pin_hash,
                 character_name=character_name,
                 teacher_id=session.created_by_id,
                 section_id=session.id,
-                pin_hash=generate_password_hash(pin),
+                pin_hash=pin_hash,
+                current_pin=pin,  # Plain text PIN for teacher viewing
                 avatar_path=(
                     f"/static/avatars/{session.character_set}/"
                     f"{character_name.lower()}.png"
@@ -1,5 +1,6 @@
 """Student service for M4 student management operations."""
 
+import random
 from typing import Any, Dict, List, Optional
 
 from werkzeug.security import generate_password_hash
@@ -108,8 +109,6 @@ class StudentService:
             return None
 
         # Generate new 6-digit PIN
-        import random
-
         new_pin = f"{random.randint(100000, 999999)}"
 
         # Update hashed fields and plain text PIN
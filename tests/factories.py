@@ -89,20 +89,23 @@ def create_session(
     return sess
 
 
-def create_student(teacher: User, session: Session) -> Student:
+def create_student(teacher: User, session: Session, flush: bool = True) -> Student:
+    """Add a student; pass ``flush=False`` to batch several into one flush."""
     pin = str(random.randint(100000, 999999))
+    pin_hash = generate_password_hash(pin)
     student = Student(
         username=f"student_{rand_code(5).lower()}",
         email=f"{rand_code(6).lower()}@example.com",
-        password_hash=generate_password_hash(pin),
+        password_hash=pin_hash,
         character_name=f"Hero-{rand_code(3)}",
         teacher_id=teacher.id,
         section_id=session.id,
-        pin_hash=generate_password_hash(pin),
+        pin_hash=pin_hash,
         current_pin=pin,  # Store plain text PIN for teacher viewing
     )
     db.session.add(student)
-    db.session.flush()
+    if flush:
+        db.session.flush()
     return student
 
 
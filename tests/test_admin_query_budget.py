@@ -0,0 +1,44 @@
+"""Tests for the development-time SQL statement budget on /admin requests."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import _count_statement, create_app
+from config import TestingConfig
+from models import db
+
+
+@pytest.fixture
+def budget_app(monkeypatch):
+    """A separate app with a zero statement budget.
+
+    The counter listens on the Engine class, so it is removed afterwards to keep
+    it from running under every later test.
+    """
+    monkeypatch.setattr(TestingConfig, "ADMIN_QUERY_BUDGET", 0)
+    budget_app = create_app("testing")
+    with budget_app.app_context():
+        db.create_all()
+    yield budget_app
+    if event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.remove(Engine, "before_cursor_execute", _count_statement)
+
+
+def test_admin_query_budget_logs_when_exceeded(budget_app, caplog):
+    client = budget_app.test_client()
+    with client.session_transaction() as sess:
+        sess["_user_id"] = "1"
+
+    with caplog.at_level("WARNING", logger=budget_app.logger.name):
+        client.get("/admin")
+        client.get("/")
+
+    warnings = [r.getMessage() for r in caplog.records]
+    assert len(warnings) == 1
+    assert warnings[0].startswith("GET /admin ran ")
+
+
+def test_admin_query_budget_is_off_by_default(app):
+    assert app.config["ADMIN_QUERY_BUDGET"] is None
+    assert not event.contains(Engine, "before_cursor_execute", _count_statement)
@@ -217,3 +217,136 @@ def test_create_teacher_with_empty_string_ids(app, client, admin_user):
         assert teacher.district.name == "Empty District"
         assert teacher.school_id is not None  # Should be set from created school
         assert teacher.district_id is not None  # Should be set from created district
+
+
+def test_create_user_reports_form_errors(app, client, admin_user):
+    """Invalid fields are flashed and no user is created."""
+    with app.app_context():
+        client.post(
+            "/login",
+            data={"username": "admin_test@example.com", "password": "password"},
+        )
+
+        response = client.post(
+            "/admin/create_user",
+            data={
+                "username": "bad_ids",
+                "email": "not-an-email",
+                "password": "password123",
+                "first_name": "Bad",
+                "last_name": "Ids",
+                "role": "teacher",
+                "school_id": "abc",
+            },
+            follow_redirects=True,
+        )
+
+        assert response.status_code == 200
+        assert b"email: Invalid email address." in response.data
+        assert b"school_id: Not a valid integer value." in response.data
+        assert User.query.filter_by(username="bad_ids").first() is None
+
+
+def test_create_user_rejects_taken_username_and_email(app, client, admin_user):
+    """Duplicates are reported before any password hashing or insert."""
+    with app.app_context():
+        client.post(
+            "/login",
+            data={"username": "admin_test@example.com", "password": "password"},
+        )
+        base = {
+            "password": "password123",
+            "first_name": "Dup",
+            "last_name": "User",
+            "role": "student",
+        }
+
+        response = client.post(
+            "/admin/create_user",
+            data={**base, "username": "admin_test", "email": "fresh@example.com"},
+            follow_redirects=True,
+        )
+        assert b"Username &#39;admin_test&#39; is already taken." in response.data
+
+        response = client.post(
+            "/admin/create_user",
+            data={**base, "username": "fresh", "email": "admin_test@example.com"},
+            follow_redirects=True,
+        )
+        assert b"Email &#39;admin_test@example.com&#39; is already in use." in (
+            response.data
+        )
+        assert User.query.filter_by(username="fresh").first() is None
+
+
+def test_create_teacher_reuses_existing_school_and_district_by_name(
+    app, client, admin_user, test_district_and_school
+):
+    """Known names resolve to the existing rows instead of inserting copies."""
+    district, school = test_district_and_school
+
+    with app.app_context():
+        client.post(
+            "/login",
+            data={"username": "admin_test@example.com", "password": "password"},
+        )
+        response = client.post(
+            "/admin/create_user",
+            data={
+                "username": "teacher_reuse",
+                "email": "teacher_reuse@example.com",
+                "password": "password123",
+                "first_name": "Reuse",
+                "last_name": "Teacher",
+                "role": "teacher",
+                "school": "Test School",
+                "district": "Test District",
+            },
+            follow_redirects=True,
+        )
+
+        assert b"User created successfully!" in response.data
+        teacher = User.query.filter_by(username="teacher_reuse").first()
+        assert teacher.school_id == school.id
+        assert teacher.district_id == district.id
+        assert School.query.filter_by(name="Test School").count() == 1
+        assert District.query.filter_by(name="Test District").count() == 1
+
+
+def test_new_district_from_user_form_is_listed_immediately(
+    app, client, admin_user, test_district_and_school
+):
+    """The Core district upsert still drops the cached district lists."""
+    _, school = test_district_and_school
+
+    from services.dashboard_lists import get_dashboard_lists
+    from services.login_choices import get_district_choices
+
+    with app.app_context():
+        client.post(
+            "/login",
+            data={"username": "admin_test@example.com", "password": "password"},
+        )
+        # Warm both caches before the district exists
+        get_district_choices()
+        get_dashboard_lists()
+
+        response = client.post(
+            "/admin/create_user",
+            data={
+                "username": "teacher_upsert",
+                "email": "teacher_upsert@example.com",
+                "password": "password123",
+                "first_name": "Upsert",
+                "last_name": "Teacher",
+                "role": "teacher",
+                # An existing school, so only the district upsert writes
+                "school_id": str(school.id),
+                "district": "Upsert District",
+            },
+            follow_redirects=True,
+        )
+
+        assert b"User created successfully!" in response.data
+        assert "Upsert District" in [name for _, name in get_district_choices()]
+        assert "Upsert District" in [d.name for d in get_dashboard_lists()[1]]
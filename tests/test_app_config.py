@@ -0,0 +1,35 @@
+"""Tests for config selection in the application factory."""
+
+import pytest
+
+import app as app_module
+from app import create_app
+from config import ProductionConfig
+
+
+@pytest.fixture
+def production_env(monkeypatch):
+    monkeypatch.setattr(ProductionConfig, "SQLALCHEMY_DATABASE_URI", "sqlite://")
+    monkeypatch.setattr(app_module, "_SCHEMA_INITIALIZED", set())
+    return monkeypatch
+
+
+@pytest.mark.parametrize("value, expected", [("1", True), ("0", False)])
+def test_production_auto_create_schema_read_at_app_creation(
+    production_env, value, expected
+):
+    # Set after config.py was imported, as a value loaded from .env would be
+    production_env.setenv("AUTO_CREATE_SCHEMA", value)
+
+    app = create_app("production")
+
+    assert app.config["AUTO_CREATE_SCHEMA"] is expected
+    assert ("sqlite://" in app_module._SCHEMA_INITIALIZED) is expected
+
+
+def test_production_auto_create_schema_off_without_env(production_env):
+    production_env.delenv("AUTO_CREATE_SCHEMA", raising=False)
+
+    app = create_app("production")
+
+    assert app.config["AUTO_CREATE_SCHEMA"] is False
@@ -0,0 +1,41 @@
+"""Tests for custom Jinja filters and context processors registered in create_app."""
+
+import sys
+
+from flask import render_template_string
+from markupsafe import Markup
+from sqlalchemy.exc import SQLAlchemyError
+
+
+def test_nl2br_escapes_and_converts_line_endings(app):
+    nl2br = app.jinja_env.filters["nl2br"]
+
+    result = nl2br("<b>hi</b>\r\nthere\nfriend")
+
+    assert isinstance(result, Markup)
+    assert result == "&lt;b&gt;hi&lt;/b&gt;<br>\nthere<br>\nfriend"
+
+
+def test_nl2br_renders_without_double_escaping(app):
+    rendered = app.jinja_env.from_string("{{ text|nl2br }}").render(text="a\nb")
+    assert rendered == "a<br>\nb"
+
+
+def test_nav_sessions_computed_once_per_request_with_fallback(app, monkeypatch):
+    calls = []
+
+    def failing_helper():
+        calls.append(1)
+        raise SQLAlchemyError("boom")
+
+    monkeypatch.setattr(
+        sys.modules["app"], "get_nav_sessions_for_current_user", failing_helper
+    )
+
+    with app.test_request_context():
+        app.preprocess_request()
+        first = render_template_string("{{ nav_sessions.type }}")
+        second = render_template_string("{{ nav_sessions.type }}")
+
+    assert first == second == "none"
+    assert len(calls) == 1
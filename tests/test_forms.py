@@ -0,0 +1,42 @@
+"""Tests for dynamically populated form choices."""
+
+from forms import MediaFilterForm
+from models import db
+from tests.factories import (
+    create_district,
+    create_media,
+    create_school,
+    create_session,
+    create_teacher,
+)
+
+
+def test_media_filter_tag_choices_are_distinct_and_sorted(app):
+    district = create_district()
+    teacher = create_teacher(district, create_school(district))
+    session = create_session(teacher)
+    for graph_tag, variable_tag in [
+        ("line_graph", "Sales"),
+        ("bar_chart", "Sales"),
+        ("bar_chart", None),
+        ("", "Temperature"),
+    ]:
+        media = create_media(session)
+        media.graph_tag = graph_tag
+        media.variable_tag = variable_tag
+    db.session.commit()
+
+    with app.test_request_context():
+        form = MediaFilterForm()
+        form.populate_tag_choices(session.id)
+
+    assert form.graph_tag.choices == [
+        ("", "All Graph Tags"),
+        ("bar_chart", "bar_chart"),
+        ("line_graph", "line_graph"),
+    ]
+    assert form.variable_tag.choices == [
+        ("", "All Variable Tags"),
+        ("Sales", "Sales"),
+        ("Temperature", "Temperature"),
+    ]
@@ -0,0 +1,45 @@
+"""Tests for the cached student-login District/School choices."""
+
+from models import db
+from services.login_choices import get_district_choices, get_school_choices
+from tests.factories import create_district, create_school
+
+
+def test_choices_include_placeholder_and_rows(app):
+    district = create_district("Alpha District")
+    school = create_school(district, "Alpha School")
+    db.session.commit()
+
+    assert get_district_choices() == [
+        (0, "Select District"),
+        (district.id, "Alpha District"),
+    ]
+    assert get_school_choices() == [(0, "Select School"), (school.id, "Alpha School")]
+
+
+def test_school_choices_narrow_to_one_district(app):
+    alpha = create_district("Alpha District")
+    beta = create_district("Beta District")
+    alpha_school = create_school(alpha, "Alpha School")
+    create_school(beta, "Beta School")
+    db.session.commit()
+
+    assert get_school_choices(alpha.id) == [
+        (0, "Select School"),
+        (alpha_school.id, "Alpha School"),
+    ]
+    assert len(get_school_choices()) == 3
+
+    create_school(alpha, "Another Alpha School")
+    db.session.commit()
+    names = [name for _, name in get_school_choices(alpha.id)]
+    assert names == ["Select School", "Alpha School", "Another Alpha School"]
+
+
+def test_student_login_page_lists_districts(client):
+    create_district("Login District")
+    db.session.commit()
+
+    resp = client.get("/student/login")
+    assert resp.status_code == 200
+    assert b"Login District" in resp.data
@@ -110,6 +110,9 @@ def test_user_roles(app):
         assert teacher.is_teacher() is True
         assert student.is_student() is True
         assert student.is_admin() is False
+        assert admin.is_admin_or_staff() is True
+        assert User(role=User.Role.STAFF).is_admin_or_staff() is True
+        assert teacher.is_admin_or_staff() is False
 
 
 def test_user_unique_constraints(test_user, app):
@@ -166,3 +169,67 @@ def test_student_creation():
     assert student.teacher_id == teacher.id
     assert student.role == User.Role.STUDENT
     assert student.type == "student"
+
+
+def test_mixed_user_query_loads_student_columns_in_one_batch(app):
+    from sqlalchemy import event
+
+    from tests.factories import (
+        create_district,
+        create_school,
+        create_session,
+        create_student,
+        create_teacher,
+    )
+
+    district = create_district()
+    teacher = create_teacher(district, create_school(district))
+    session = create_session(teacher)
+    for _ in range(3):
+        create_student(teacher, session, flush=False)
+    db.session.commit()
+    db.session.expunge_all()
+
+    statements = []
+
+    def count(*_args):
+        statements.append(1)
+
+    connection = db.session.connection()
+    event.listen(connection, "before_cursor_execute", count)
+    try:
+        users = User.query.all()
+        names = [u.character_name for u in users if isinstance(u, Student)]
+    finally:
+        event.remove(connection, "before_cursor_execute", count)
+
+    assert len(names) == 3
+    # One SELECT for users plus one batched SELECT for the student rows
+    assert len(statements) == 2
+
+
+def test_foreign_key_lookup_columns_are_indexed():
+    from models import Session
+
+    user_indexes = {index.name for index in User.__table__.indexes}
+    session_indexes = {index.name for index in Session.__table__.indexes}
+    assert {"ix_users_school_id", "ix_users_district_id"} <= user_indexes
+    assert "ix_users_created_at" in user_indexes
+    assert "ix_sessions_module_id" in session_indexes
+
+
+def test_created_at_orders_rows_committed_in_sequence(app):
+    """Timestamps are sub-second, so back-to-back rows don't tie."""
+    with app.app_context():
+        users = []
+        for i in range(3):
+            user = User(
+                username=f"seq{i}", email=f"seq{i}@example.com", password_hash="x"
+            )
+            db.session.add(user)
+            db.session.commit()
+            users.append(user)
+
+        stamps = [user.created_at for user in users]
+        assert stamps == sorted(stamps)
+        assert len(set(stamps)) == 3
@@ -4,6 +4,7 @@ import pytest
 from werkzeug.security import generate_password_hash
 
 from models import Module, Session, User, db
+from services.module_choices import get_module_choices
 
 
 @pytest.fixture
@@ -176,6 +177,10 @@ class TestModuleModel:
             assert ordered_modules[1].name == "Module B"
             assert ordered_modules[2].name == "Module C"
 
+    def test_module_display_name_is_its_name(self, app):
+        """Templates render module.display_name."""
+        assert Module(name="Data Stories").display_name == "Data Stories"
+
 
 class TestModuleAdminRoutes:
     """Test Module admin interface routes."""
@@ -267,6 +272,96 @@ class TestModuleAdminRoutes:
             assert updated_module.is_active is False
             assert updated_module.sort_order == 10
 
+    def test_admin_module_duplicate_names_rejected(self, client, admin_user):
+        """The unique constraint on name reports duplicates on create and edit."""
+        with client.application.app_context():
+            db.session.add_all([Module(name="Taken"), Module(name="Other")])
+            db.session.commit()
+            other_id = Module.query.filter_by(name="Other").one().id
+
+        with client.session_transaction() as sess:
+            sess["_user_id"] = str(admin_user.id)
+            sess["_fresh"] = True
+
+        response = client.post(
+            "/admin/create_module",
+            data={"name": "Taken", "sort_order": "0", "csrf_token": "test"},
+            follow_redirects=True,
+        )
+        assert b"Module &#39;Taken&#39; already exists." in response.data
+
+        response = client.post(
+            f"/admin/edit_module/{other_id}",
+            data={"name": "Taken", "sort_order": "0", "csrf_token": "test"},
+            follow_redirects=True,
+        )
+        assert b"Module name &#39;Taken&#39; already exists." in response.data
+
+        with client.application.app_context():
+            assert Module.query.filter_by(name="Taken").count() == 1
+            assert db.session.get(Module, other_id).name == "Other"
+
+    def test_admin_delete_module_only_when_unused(
+        self, client, admin_user, teacher_user
+    ):
+        """Modules used by a session cannot be deleted."""
+        with client.application.app_context():
+            used = Module(name="Used Module")
+            unused = Module(name="Unused Module")
+            db.session.add_all([used, unused])
+            db.session.flush()
+            db.session.add(
+                Session(
+                    name="Uses Module",
+                    section=1,
+                    module_id=used.id,
+                    session_code="USEDMOD1",
+                    created_by_id=teacher_user.id,
+                )
+            )
+            db.session.commit()
+            used_id, unused_id = used.id, unused.id
+
+        with client.session_transaction() as sess:
+            sess["_user_id"] = str(admin_user.id)
+            sess["_fresh"] = True
+
+        response = client.post(f"/admin/delete_module/{used_id}")
+        assert response.status_code == 400
+        assert "used by 1 session(s)" in response.get_json()["message"]
+
+        response = client.post(f"/admin/delete_module/{unused_id}")
+        assert response.get_json() == {"success": True}
+
+        with client.application.app_context():
+            assert db.session.get(Module, used_id) is not None
+            assert db.session.get(Module, unused_id) is None
+
+    def test_admin_toggle_module(self, client, admin_user):
+        """Toggling flips is_active and refreshes the cached form choices."""
+        with client.application.app_context():
+            module = Module(name="Toggled Module", is_active=True)
+            db.session.add(module)
+            db.session.commit()
+            module_id = module.id
+            assert get_module_choices() == [(module_id, "Toggled Module")]
+
+        with client.session_transaction() as sess:
+            sess["_user_id"] = str(admin_user.id)
+            sess["_fresh"] = True
+
+        response = client.post(
+            f"/admin/toggle_module/{module_id}", follow_redirects=True
+        )
+        assert b"Module &#39;Toggled Module&#39; deactivated successfully!" in (
+            response.data
+        )
+        with client.application.app_context():
+            assert db.session.get(Module, module_id).is_active is False
+            assert get_module_choices() == []
+
+        assert client.post("/admin/toggle_module/999999").status_code == 404
+
     def test_admin_module_list_shows_all_modules(self, client, admin_user):
         """Test that admin can access dashboard and modules are available."""
         # Login as admin
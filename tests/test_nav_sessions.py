@@ -0,0 +1,51 @@
+"""Tests for the role-based nav session helpers."""
+
+from flask_login import login_user
+
+from models import User, db
+from services.nav_sessions import get_nav_sessions_for_current_user
+from tests.factories import (
+    create_district,
+    create_module,
+    create_school,
+    create_session,
+    create_teacher,
+)
+
+
+def test_teacher_nav_rows_include_module_name(app):
+    district = create_district()
+    teacher = create_teacher(district, create_school(district))
+    create_session(teacher, section=2, module=create_module("Nav Module"))
+    db.session.commit()
+
+    with app.test_request_context():
+        login_user(teacher)
+        nav = get_nav_sessions_for_current_user()
+
+    assert nav["type"] == "teacher"
+    [row] = nav["data"]
+    assert (row.name, row.section, row.module_name) == ("Hour 2", 2, "Nav Module")
+
+
+def test_admin_nav_groups_rows_by_district_and_school(app):
+    district = create_district("Nav District")
+    teacher = create_teacher(district, create_school(district, "Nav School"))
+    teacher.first_name, teacher.last_name = "Ada", "Lovelace"
+    create_session(teacher)
+    admin = User(
+        username="nav_admin",
+        email="nav_admin@example.com",
+        password_hash="hash",
+        role=User.Role.ADMIN,
+    )
+    db.session.add(admin)
+    db.session.commit()
+
+    with app.test_request_context():
+        login_user(admin)
+        nav = get_nav_sessions_for_current_user()
+
+    assert nav["type"] == "admin"
+    [row] = nav["data"]["Nav District"]["Nav School"]
+    assert (row.creator_first_name, row.creator_last_name) == ("Ada", "Lovelace")
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import pytest
 
 from models import (
@@ -9,6 +11,7 @@ from models import (
     StudentMediaInteraction,
     User,
     db,
+    student_media_interaction,
 )
 
 
@@ -159,3 +162,229 @@ def test_comment_self_relationship(app, teacher, module):
 
         assert child.parent_id == parent.id
         assert parent.replies.count() == 1
+
+
+def test_find_active_conflict_ignores_archived_sessions(app, teacher, module):
+    with app.app_context():
+        archived = Session(
+            name="Hour 2 (old)",
+            session_code="ARCHIVED",
+            section=2,
+            module_id=module.id,
+            created_by_id=teacher.id,
+            is_archived=True,
+        )
+        db.session.add(archived)
+        db.session.commit()
+        assert Session.find_active_conflict(teacher.id, 2) is None
+
+        active = Session(
+            name="Hour 2",
+            session_code="ACTIVE22",
+            section=2,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(active)
+        db.session.commit()
+        assert Session.find_active_conflict(teacher.id, 2) == active
+        assert Session.find_active_conflict(teacher.id, 2, active.id) is None
+
+
+def test_deleting_media_deletes_its_interactions(app, teacher, module):
+    with app.app_context():
+        session = Session(
+            name="Hour 3",
+            session_code="DELMEDIA",
+            section=3,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+
+        student = Student(
+            username="stud3",
+            email="stud3@example.com",
+            password_hash="hash",
+            character_name="Hero",
+            teacher_id=teacher.id,
+            section_id=session.id,
+        )
+        media = Media(
+            session_id=session.id,
+            title="Image 3",
+            media_type="image",
+            image_file="/tmp/3.png",
+        )
+        db.session.add_all([student, media])
+        db.session.commit()
+
+        db.session.add(
+            StudentMediaInteraction(student_id=student.id, media_id=media.id)
+        )
+        db.session.commit()
+
+        db.session.delete(media)
+        db.session.commit()
+
+        assert StudentMediaInteraction.query.count() == 0
+
+
+def test_session_repr_does_not_lazy_load_module(app, teacher, module):
+    with app.app_context():
+        session = Session(
+            name="Hour 4",
+            session_code="REPRTEST",
+            section=4,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+        session_id, module_id = session.id, module.id
+        db.session.expunge_all()
+
+        loaded = db.session.get(Session, session_id)
+        assert repr(loaded) == f"<Session Hour 4 (Section 4, module_id={module_id})>"
+        assert "module" not in loaded.__dict__
+
+
+def test_comment_tree_for_media_nests_replies(app, teacher, module):
+    with app.app_context():
+        session = Session(
+            name="Hour 5",
+            session_code="TREETEST",
+            section=5,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+        media = Media(
+            session_id=session.id,
+            title="Image 5",
+            media_type="image",
+            image_file="/tmp/5.png",
+        )
+        db.session.add(media)
+        db.session.commit()
+
+        first = Comment(media_id=media.id, text="first")
+        second = Comment(media_id=media.id, text="second")
+        db.session.add_all([first, second])
+        db.session.commit()
+        reply = Comment(media_id=media.id, parent_id=first.id, text="reply")
+        db.session.add(reply)
+        db.session.commit()
+
+        tree = Comment.tree_for_media(media.id)
+
+        assert [c.text for c in tree] == ["first", "second"]
+        assert [r.text for r in tree[0].nested_replies] == ["reply"]
+        assert tree[1].nested_replies == []
+        assert not db.session.dirty
+
+
+def test_interaction_bulk_upsert_inserts_and_updates(app, teacher, module, monkeypatch):
+    updated_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    with app.app_context():
+        session = Session(
+            name="Hour 6",
+            session_code="UPSERTS1",
+            section=6,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+        student = Student(
+            username="stud6",
+            email="stud6@example.com",
+            password_hash="hash",
+            character_name="Hero",
+            teacher_id=teacher.id,
+            section_id=session.id,
+        )
+        media = [
+            Media(
+                session_id=session.id,
+                title=f"Image 6.{i}",
+                media_type="image",
+                image_file=f"/tmp/6{i}.png",
+            )
+            for i in range(2)
+        ]
+        db.session.add_all([student, *media])
+        db.session.commit()
+
+        StudentMediaInteraction.bulk_upsert(
+            [
+                {"student_id": student.id, "media_id": m.id, "liked_graph": True}
+                for m in media
+            ]
+        )
+        monkeypatch.setattr(student_media_interaction, "_utcnow", lambda: updated_at)
+        StudentMediaInteraction.bulk_upsert(
+            [{"student_id": student.id, "media_id": media[0].id, "liked_graph": False}]
+        )
+        db.session.commit()
+
+        rows = StudentMediaInteraction.query.order_by(
+            StudentMediaInteraction.media_id
+        ).all()
+        assert [r.liked_graph for r in rows] == [False, True]
+        assert all(r.comment_count == 0 for r in rows)
+        # Conflicting rows are stamped by the Python clock, microseconds included
+        assert rows[0].updated_at.replace(tzinfo=timezone.utc) == updated_at
+        assert rows[1].updated_at.replace(tzinfo=timezone.utc) != updated_at
+
+
+def test_media_project_images_deferred_on_list_queries(app, teacher, module):
+    with app.app_context():
+        session = Session(
+            name="Hour 7",
+            session_code="DEFERRED",
+            section=7,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+        db.session.add(
+            Media(
+                session_id=session.id,
+                title="Deck",
+                media_type="image",
+                image_file="/tmp/7.png",
+                is_project=True,
+                project_images=["/tmp/7.png", "/tmp/8.png"],
+            )
+        )
+        db.session.commit()
+        db.session.expunge_all()
+
+        [media] = Media.query.all()
+        assert "project_images" not in media.__dict__
+        assert media.project_images == ["/tmp/7.png", "/tmp/8.png"]
+
+
+def test_session_archive_timestamp_is_comparable_with_created_at(app, teacher, module):
+    with app.app_context():
+        session = Session(
+            name="Hour 8",
+            session_code="ARCHIVE8",
+            section=8,
+            module_id=module.id,
+            created_by_id=teacher.id,
+        )
+        db.session.add(session)
+        db.session.commit()
+
+        session.archive()
+        # Both timestamps are naive UTC, before and after a reload
+        assert session.archived_at.tzinfo is None
+        assert session.archived_at >= session.created_at
+        db.session.commit()
+        db.session.refresh(session)
+        assert session.archived_at >= session.created_at
@@ -3,6 +3,13 @@
 from unittest.mock import MagicMock, patch
 
 from services.pin_cards_service import PinCardsService
+from tests.factories import create_district, create_school, create_teacher
+
+
+def _create_other_teacher():
+    """A teacher in their own district and school, unrelated to ``teacher_user``."""
+    district = create_district()
+    return create_teacher(district, create_school(district), "other_teacher")
 
 
 class TestPinCardsService:
@@ -21,12 +28,11 @@ class TestPinCardsService:
         assert filename.endswith(".pdf")
         assert session_with_students.name.replace(" ", "_") in filename
 
-    def test_generate_pin_cards_pdf_unauthorized(
-        self, teacher_user, session_factory, teacher_factory
-    ):
+    def test_generate_pin_cards_pdf_unauthorized(self, teacher_user, session_factory):
         """Test PDF generation fails for unauthorized session."""
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
         session = session_factory(created_by_id=other_teacher.id)
+        assert session.created_by_id == other_teacher.id != teacher_user.id
 
         result = PinCardsService.generate_pin_cards_pdf(session.id, teacher_user.id)
         assert result is None
@@ -97,12 +103,11 @@ class TestPinCardsService:
         assert summary["session"]["name"] == session_with_students.name
         assert summary["total_students"] > 0
 
-    def test_get_session_pin_summary_unauthorized(
-        self, teacher_user, session_factory, teacher_factory
-    ):
+    def test_get_session_pin_summary_unauthorized(self, teacher_user, session_factory):
         """Test session PIN summary fails for unauthorized access."""
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
         session = session_factory(created_by_id=other_teacher.id)
+        assert session.created_by_id == other_teacher.id != teacher_user.id
 
         summary = PinCardsService.get_session_pin_summary(session.id, teacher_user.id)
         assert summary is None
@@ -1,3 +1,4 @@
+import pytest
 from werkzeug.security import generate_password_hash
 
 from models import District, School, User, db
@@ -92,3 +93,418 @@ def test_admin_create_and_delete_user_flow(app, client):
     delete_resp = client.post(f"/admin/delete_user/{user_id}")
     assert delete_resp.status_code == 200
     assert delete_resp.json["success"] is True
+
+
+def test_admin_dashboard_counts_users_per_district_and_school(app):
+    from routes.admin import _dashboard_counts
+
+    with app.app_context():
+        district = District(name="Counted", code="CNT")
+        db.session.add(district)
+        db.session.flush()
+        school = School(name="Counted School", code="CS", district_id=district.id)
+        db.session.add(school)
+        db.session.flush()
+        for i, school_id in enumerate([school.id, school.id, None]):
+            db.session.add(
+                User(
+                    username=f"counted{i}",
+                    email=f"counted{i}@example.com",
+                    password_hash="x",
+                    role=User.Role.TEACHER,
+                    district_id=district.id,
+                    school_id=school_id,
+                )
+            )
+        db.session.commit()
+
+        counts = _dashboard_counts([school])
+        assert counts["district_schools"][district.id] == 1
+        assert counts["district_users"][district.id] == 3
+        assert counts["school_users"][school.id] == 2
+        assert counts["school_users"][school.id + 1] == 0
+
+
+def test_admin_dashboard_query_count_does_not_grow_with_users(app, client):
+    from sqlalchemy import event
+
+    with app.app_context():
+        make_admin()
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    def add_staff_with_school(start, stop):
+        with app.app_context():
+            for i in range(start, stop):
+                district = District(name=f"District {i}", code=f"D{i}")
+                db.session.add(district)
+                db.session.flush()
+                school = School(
+                    name=f"School {i}", code=f"S{i}", district_id=district.id
+                )
+                db.session.add(school)
+                db.session.flush()
+                db.session.add(
+                    User(
+                        username=f"staff{i}",
+                        email=f"staff{i}@example.com",
+                        password_hash="x",
+                        role=User.Role.STAFF,
+                        district_id=district.id,
+                        school_id=school.id,
+                    )
+                )
+            db.session.commit()
+
+    def dashboard_statements():
+        statements = []
+
+        def count(*_args):
+            statements.append(1)
+
+        connection = db.session.connection()
+        event.listen(connection, "before_cursor_execute", count)
+        try:
+            assert client.get("/admin").status_code == 200
+        finally:
+            event.remove(connection, "before_cursor_execute", count)
+        return len(statements)
+
+    add_staff_with_school(0, 1)
+    baseline = dashboard_statements()
+    add_staff_with_school(1, 4)
+    assert dashboard_statements() == baseline
+
+
+def test_admin_dashboard_paginates_users(app, client):
+    import re
+    from datetime import datetime, timezone
+
+    # Identical timestamps: only the id tiebreaker keeps the pages stable
+    tied = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with app.app_context():
+        make_admin()
+        db.session.add_all(
+            User(
+                username=f"paged{i:02d}",
+                email=f"paged{i:02d}@example.com",
+                password_hash="x",
+                role=User.Role.STAFF,
+                created_at=tied,
+            )
+            for i in range(55)
+        )
+        db.session.commit()
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    first = client.get("/admin").get_data(as_text=True)
+    second = client.get("/admin?page=2").get_data(as_text=True)
+
+    def usernames(html):
+        return re.findall(r"<td>(paged\d\d|admin1)</td>", html)
+
+    first_page, second_page = usernames(first), usernames(second)
+    assert len(first_page) == 50
+    assert not set(first_page) & set(second_page)
+    expected = {"admin1"} | {f"paged{i:02d}" for i in range(55)}
+    assert set(first_page) | set(second_page) == expected
+    assert "of 56 results" in first
+
+    # SQLite happens to return ties in rowid order; other databases need the
+    # explicit tiebreaker
+    from routes.admin import _user_list_query
+
+    with app.app_context():
+        order = str(_user_list_query()).split("ORDER BY")[1]
+    assert order.strip() == "users.created_at DESC, users.id DESC"
+
+
+def test_admin_edit_user_get_returns_form_fields(app, client):
+    with app.app_context():
+        make_admin()
+        teacher = User(
+            username="editme",
+            email="editme@example.com",
+            password_hash="x",
+            first_name="Edit",
+            last_name="Me",
+            role=User.Role.TEACHER,
+        )
+        db.session.add(teacher)
+        db.session.commit()
+        teacher_id = teacher.id
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    resp = client.get(f"/admin/edit_user/{teacher_id}")
+    assert resp.get_json() == {
+        "username": "editme",
+        "email": "editme@example.com",
+        "first_name": "Edit",
+        "last_name": "Me",
+        "role": "teacher",
+        "school_id": None,
+        "district_id": None,
+    }
+    assert client.get("/admin/edit_user/999999").status_code == 404
+
+
+def test_dashboard_user_query_raises_on_unloaded_relationships(app):
+    from sqlalchemy.exc import InvalidRequestError
+
+    from models import Observer
+    from routes.admin import _user_list_query
+
+    with app.app_context():
+        admin = make_admin()
+        district = District(name="Raise", code="RSE")
+        db.session.add(district)
+        db.session.flush()
+        school = School(name="Raise School", code="RS", district_id=district.id)
+        db.session.add(school)
+        db.session.flush()
+        db.session.add(
+            Observer(
+                username="watcher",
+                email="watcher@example.com",
+                password_hash="x",
+                role=User.Role.OBSERVER,
+                school_id=school.id,
+                district_id=district.id,
+                created_by_id=admin.id,
+            )
+        )
+        db.session.commit()
+        db.session.expunge_all()
+
+        users = db.session.scalars(_user_list_query()).all()
+        observer = next(u for u in users if isinstance(u, Observer))
+        # Eager-loaded for the template
+        assert (observer.school.name, observer.district.name) == (
+            "Raise School",
+            "Raise",
+        )
+        with pytest.raises(InvalidRequestError):
+            observer.created_by
+
+
+def test_admin_edit_user_rejects_non_numeric_ids(app, client):
+    with app.app_context():
+        make_admin()
+        teacher = User(
+            username="badid",
+            email="badid@example.com",
+            password_hash="x",
+            role=User.Role.TEACHER,
+        )
+        db.session.add(teacher)
+        db.session.commit()
+        teacher_id = teacher.id
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    form = {
+        "username": "badid",
+        "email": "badid@example.com",
+        "first_name": "",
+        "last_name": "",
+        "role": "teacher",
+    }
+    resp = client.post(
+        f"/admin/edit_user/{teacher_id}", data={**form, "school_id": "-1"}
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["message"] == "Invalid school ID"
+
+    resp = client.post(
+        f"/admin/edit_user/{teacher_id}", data={**form, "district_id": "1.5"}
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["message"] == "Invalid district ID"
+
+
+def test_admin_delete_district_and_school_only_when_empty(app, client):
+    with app.app_context():
+        make_admin()
+        district = District(name="Busy", code="BSY")
+        empty_district = District(name="Empty", code="EMP")
+        db.session.add_all([district, empty_district])
+        db.session.flush()
+        school = School(name="Busy School", code="BS", district_id=district.id)
+        db.session.add(school)
+        db.session.flush()
+        db.session.add(
+            User(
+                username="enrolled",
+                email="enrolled@example.com",
+                password_hash="x",
+                role=User.Role.TEACHER,
+                district_id=district.id,
+                school_id=school.id,
+            )
+        )
+        db.session.commit()
+        ids = district.id, empty_district.id, school.id
+    district_id, empty_district_id, school_id = ids
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    assert client.post(f"/admin/districts/{district_id}/delete").status_code == 400
+    assert client.post(f"/admin/schools/{school_id}/delete").status_code == 400
+    resp = client.post(f"/admin/districts/{empty_district_id}/delete")
+    assert resp.get_json()["success"] is True
+
+    with app.app_context():
+        assert db.session.get(District, district_id) is not None
+        assert db.session.get(School, school_id) is not None
+        assert db.session.get(District, empty_district_id) is None
+
+
+def test_admin_edit_district_reports_name_and_code_clashes(app, client):
+    with app.app_context():
+        make_admin()
+        db.session.add_all(
+            [District(name="North", code="N"), District(name="South", code=None)]
+        )
+        db.session.commit()
+        south_id = District.query.filter_by(name="South").one().id
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    def edit(**data):
+        return client.post(
+            f"/admin/districts/{south_id}/edit", data=data, follow_redirects=True
+        ).get_data(as_text=True)
+
+    assert "already uses the name &#39;North&#39;" in edit(name="North", code="")
+    assert "already uses the code &#39;N&#39;" in edit(name="South", code="N")
+    assert "District updated successfully." in edit(name="Southern", code="S")
+    with app.app_context():
+        south = db.session.get(District, south_id)
+        assert (south.name, south.code) == ("Southern", "S")
+
+
+def test_admin_assign_teacher_validates_district_and_school(app, client):
+    with app.app_context():
+        make_admin()
+        home = District(name="Home", code="HOM")
+        away = District(name="Away", code="AWY")
+        db.session.add_all([home, away])
+        db.session.flush()
+        school = School(name="Home School", code="HS", district_id=home.id)
+        teacher = User(
+            username="assignee",
+            email="assignee@example.com",
+            password_hash="x",
+            role=User.Role.TEACHER,
+        )
+        db.session.add_all([school, teacher])
+        db.session.commit()
+        ids = teacher.id, home.id, away.id, school.id
+    teacher_id, home_id, away_id, school_id = ids
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+    url = f"/admin/teachers/{teacher_id}/assign"
+
+    resp = client.post(url, data={"district_id": "999999"})
+    assert resp.status_code == 404
+    assert resp.get_json()["message"] == "District not found."
+    resp = client.post(url, data={"district_id": home_id, "school_id": "999999"})
+    assert resp.get_json()["message"] == "School not found."
+    resp = client.post(url, data={"district_id": away_id, "school_id": school_id})
+    assert resp.status_code == 400
+
+    resp = client.post(url, data={"district_id": home_id, "school_id": school_id})
+    assert resp.get_json() == {"success": True}
+    with app.app_context():
+        teacher = db.session.get(User, teacher_id)
+        assert (teacher.district_id, teacher.school_id) == (home_id, school_id)
+
+
+def test_admin_dashboard_create_user_form_only_for_admins(app, client):
+    with app.app_context():
+        db.session.add(
+            User(
+                username="staffer",
+                email="staffer@example.com",
+                password_hash=generate_password_hash("pw"),
+                role=User.Role.STAFF,
+            )
+        )
+        db.session.commit()
+    client.post("/login", data={"username": "staffer", "password": "pw"})
+
+    resp = client.get("/admin")
+    assert resp.status_code == 200
+    assert "Create New User" not in resp.get_data(as_text=True)
+
+
+def test_admin_toggle_observer_and_assign_district(app, client):
+    from models import Observer
+    from services.dashboard_counts import get_user_counts
+
+    with app.app_context():
+        admin = make_admin()
+        district = District(name="Watched", code="WAT")
+        observer = Observer(
+            username="watcher",
+            email="watcher@example.com",
+            password_hash="x",
+            role=User.Role.OBSERVER,
+        )
+        db.session.add_all([district, observer])
+        db.session.commit()
+        ids = admin.id, observer.id, district.id
+        assert get_user_counts()[0][district.id] == 0
+    admin_id, observer_id, district_id = ids
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    resp = client.post(f"/admin/observers/{observer_id}/toggle", follow_redirects=True)
+    assert b"Observer deactivated successfully." in resp.data
+    resp = client.post(f"/admin/observers/{admin_id}/toggle", follow_redirects=True)
+    assert b"Selected user is not an observer." in resp.data
+    assert client.post("/admin/observers/999999/toggle").status_code == 404
+
+    url = f"/admin/observers/{observer_id}/assign-district"
+    resp = client.post(url, data={"district_id": "999999"})
+    assert resp.get_json()["message"] == "Invalid district."
+    resp = client.post(url, data={"district_id": ""})
+    assert resp.get_json()["message"] == "District is required."
+    resp = client.post(
+        f"/admin/observers/{admin_id}/assign-district",
+        data={"district_id": district_id},
+    )
+    assert resp.get_json()["message"] == "Selected user is not an observer."
+
+    resp = client.post(url, data={"district_id": district_id})
+    assert resp.get_json() == {"success": True}
+    with app.app_context():
+        observer = db.session.get(Observer, observer_id)
+        assert observer.is_active is False
+        assert observer.district_id == district_id
+        assert get_user_counts()[0][district_id] == 1
+
+
+def test_admin_create_district_and_school_report_duplicates(app, client):
+    with app.app_context():
+        make_admin()
+        district = District(name="Taken", code="TK")
+        db.session.add(district)
+        db.session.flush()
+        db.session.add(School(name="Taken School", code="TS", district_id=district.id))
+        db.session.commit()
+        district_id = district.id
+    client.post("/login", data={"username": "admin1", "password": "pw"})
+
+    def post(url, **data):
+        return client.post(url, data=data, follow_redirects=True).get_data(as_text=True)
+
+    assert "District &#39;Taken&#39; already exists." in post(
+        "/admin/districts/create", name="Taken", code="NEW"
+    )
+    assert "District code &#39;TK&#39; already exists." in post(
+        "/admin/districts/create", name="Fresh", code="TK"
+    )
+    assert "District &#39;Fresh&#39; created." in post(
+        "/admin/districts/create", name="Fresh", code="FR"
+    )
+    assert "School code &#39;TS&#39; already exists." in post(
+        "/admin/schools/create", name="Other", code="TS", district_id=district_id
+    )
+    with app.app_context():
+        assert District.query.count() == 2
+        assert School.query.count() == 1
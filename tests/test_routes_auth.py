@@ -35,6 +35,22 @@ def test_login_invalid_credentials(app, client):
     assert resp.status_code == 200
 
 
+def test_login_prefers_email_match_over_same_username(app, client):
+    with app.app_context():
+        create_user("carol", "by-email")
+        # Another account whose username is carol's email address
+        create_user("carol@example.com", "by-username")
+
+    resp = client.post(
+        "/login", data={"username": "carol@example.com", "password": "by-email"}
+    )
+    assert resp.status_code == 302
+    resp = client.post(
+        "/login", data={"username": "carol@example.com", "password": "by-username"}
+    )
+    assert resp.status_code == 200
+
+
 def test_logout_requires_login(client):
     resp = client.get("/logout")
     # Redirect to login because of @login_required
@@ -99,3 +99,153 @@ def test_observer_school_lists_teachers(app, client):
     resp = client.get(f"/observer/schools/{school_id}")
     assert resp.status_code == 200
     assert b"teachx@example.com" in resp.data
+
+
+def test_observer_school_teacher_stats(app, client):
+    from models import Media, Module, Session
+
+    with app.app_context():
+        d = District(name="DS", code="DS")
+        db.session.add(d)
+        db.session.commit()
+        make_observer("obs4@example.com", "pw", d)
+        school = make_school("SchoolS", d)
+        school_id = school.id
+        busy, idle = (
+            User(
+                username=name,
+                email=f"{name}@example.com",
+                password_hash="x",
+                role=User.Role.TEACHER,
+                school_id=school.id,
+                district_id=d.id,
+                first_name="T",
+                last_name=name,
+            )
+            for name in ("busy", "idle")
+        )
+        module = Module(name="Stats Module")
+        db.session.add_all([busy, idle, module])
+        db.session.flush()
+        sessions = [
+            Session(
+                name=f"S{i}",
+                session_code=f"STAT{i}",
+                section=i,
+                module_id=module.id,
+                created_by_id=busy.id,
+            )
+            for i in (1, 2)
+        ]
+        db.session.add_all(sessions)
+        db.session.flush()
+        db.session.add(
+            Media(title="Chart", media_type="image", session_id=sessions[0].id)
+        )
+        db.session.commit()
+
+    client.post("/login", data={"username": "obs4@example.com", "password": "pw"})
+    html = client.get(f"/observer/schools/{school_id}").get_data(as_text=True)
+    busy_html, idle_html = html.split("idle@example.com")
+    assert "<strong>2</strong> sessions" in busy_html
+    assert "1 media" in busy_html
+    assert "<strong>0</strong> sessions" in idle_html
+    assert "0 media" in idle_html
+
+
+def test_observer_dashboard_counts_district_teachers_and_sessions(app, client):
+    from models import Media, Module, Session
+
+    with app.app_context():
+        home = District(name="DH", code="DH")
+        away = District(name="DW", code="DW")
+        db.session.add_all([home, away])
+        db.session.commit()
+        make_observer("obs5@example.com", "pw", home)
+        teachers = [
+            User(
+                username=name,
+                email=f"{name}@example.com",
+                password_hash="x",
+                role=User.Role.TEACHER,
+                district_id=district.id,
+            )
+            for name, district in (("h1", home), ("h2", home), ("w1", away))
+        ]
+        module = Module(name="Dashboard Module")
+        db.session.add_all([*teachers, module])
+        db.session.flush()
+        sessions = [
+            Session(
+                name=f"D{i}",
+                session_code=f"DASH{i}",
+                section=i,
+                module_id=module.id,
+                created_by_id=teacher.id,
+            )
+            for i, teacher in enumerate(teachers)
+        ]
+        db.session.add_all(sessions)
+        db.session.flush()
+        db.session.add_all(
+            Media(title=f"M{i}", media_type="image", session_id=s.id)
+            for i, s in enumerate(sessions)
+        )
+        db.session.commit()
+
+    client.post("/login", data={"username": "obs5@example.com", "password": "pw"})
+    html = client.get("/observer/dashboard").get_data(as_text=True)
+    counts = [
+        line.split(">")[1].split("<")[0]
+        for line in html.splitlines()
+        if 'class="h4 mb-0"' in line
+    ]
+    assert counts == ["2", "2", "2"]
+    assert ">M0<" in html and ">M1<" in html and ">M2<" not in html
+
+
+def test_observer_teacher_page_lists_sessions_with_modules(app, client):
+    from models import Media, Module, Session
+
+    with app.app_context():
+        d = District(name="DT", code="DT")
+        db.session.add(d)
+        db.session.commit()
+        make_observer("obs6@example.com", "pw", d)
+        school = make_school("SchoolT", d)
+        teacher = User(
+            username="detailed",
+            email="detailed@example.com",
+            password_hash="x",
+            role=User.Role.TEACHER,
+            school_id=school.id,
+            district_id=d.id,
+        )
+        modules = [Module(name="Module A"), Module(name="Module B")]
+        db.session.add_all([teacher, *modules])
+        db.session.flush()
+        sessions = [
+            Session(
+                name=f"Class {i}",
+                session_code=f"DET{i}",
+                section=i,
+                module_id=module.id,
+                created_by_id=teacher.id,
+            )
+            for i, module in enumerate(modules)
+        ]
+        db.session.add_all(sessions)
+        db.session.flush()
+        db.session.add(
+            Media(title="Poster", media_type="image", session_id=sessions[0].id)
+        )
+        db.session.commit()
+        teacher_id = teacher.id
+
+    client.post("/login", data={"username": "obs6@example.com", "password": "pw"})
+    # Any per-row lazy load raises under the testing config's STRICT_LOADING
+    resp = client.get(f"/observer/teachers/{teacher_id}")
+    assert resp.status_code == 200
+    html = resp.get_data(as_text=True)
+    assert "Module A" in html and "Module B" in html
+    assert "Poster" in html
@@ -24,3 +24,97 @@ def test_student_logout_endpoint(client):
     # Verify student_id was removed from session
     with client.session_transaction() as sess:
         assert "student_id" not in sess
+
+
+def test_student_login_verifies_only_the_matching_pin(app, client, monkeypatch):
+    """The slow hash check runs for the student showing the PIN, not everyone."""
+    import sys
+
+    from werkzeug.security import check_password_hash, generate_password_hash
+
+    from models import Student, User, db
+
+    with app.app_context():
+        teacher = User(
+            username="pinteacher",
+            email="pinteacher@example.com",
+            password_hash="x",
+            role=User.Role.TEACHER,
+        )
+        db.session.add(teacher)
+        db.session.flush()
+        for i, pin in enumerate(("111111", "222222", "333333")):
+            db.session.add(
+                Student(
+                    username=f"pinstudent{i}",
+                    email=f"pinstudent{i}@example.com",
+                    password_hash=generate_password_hash(pin),
+                    character_name=f"Hero{i}",
+                    teacher_id=teacher.id,
+                    pin_hash=generate_password_hash(pin),
+                    current_pin=pin,
+                )
+            )
+        db.session.commit()
+
+    checks = []
+
+    def counting_check(pwhash, password):
+        checks.append(password)
+        return check_password_hash(pwhash, password)
+
+    monkeypatch.setattr(
+        sys.modules["routes.main"], "check_password_hash", counting_check
+    )
+
+    resp = client.post(
+        "/student/login", data={"district_id": 0, "school_id": 0, "pin": "222222"}
+    )
+    assert resp.status_code == 302
+    assert checks == ["222222"]
+    with client.session_transaction() as sess:
+        assert sess["student_id"]
+
+    checks.clear()
+    resp = client.post(
+        "/student/login", data={"district_id": 0, "school_id": 0, "pin": "999999"}
+    )
+    assert resp.status_code == 200
+    # A PIN nobody shows falls back to checking every hash in scope
+    assert sorted(checks) == ["999999"] * 3
+
+
+def test_student_login_matches_hash_when_current_pin_is_stale(app, client):
+    """pin_hash decides even when current_pin was not updated with it."""
+    from werkzeug.security import generate_password_hash
+
+    from models import Student, User, db
+
+    with app.app_context():
+        teacher = User(
+            username="staleteacher",
+            email="staleteacher@example.com",
+            password_hash="x",
+            role=User.Role.TEACHER,
+        )
+        db.session.add(teacher)
+        db.session.flush()
+        student = Student(
+            username="stalestudent",
+            email="stalestudent@example.com",
+            password_hash=generate_password_hash("444444"),
+            character_name="Stale",
+            teacher_id=teacher.id,
+            pin_hash=generate_password_hash("444444"),
+            current_pin="555555",
+        )
+        db.session.add(student)
+        db.session.commit()
+        student_id = student.id
+
+    resp = client.post(
+        "/student/login", data={"district_id": 0, "school_id": 0, "pin": "444444"}
+    )
+    assert resp.status_code == 302
+    with client.session_transaction() as sess:
+        assert sess["student_id"] == student_id
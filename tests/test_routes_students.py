@@ -7,6 +7,13 @@ from flask import url_for
 
 from models import Student, db
 from services.student_service import StudentService
+from tests.factories import create_district, create_school, create_teacher
+
+
+def _create_other_teacher():
+    """A teacher in their own district and school, unrelated to ``teacher_user``."""
+    district = create_district()
+    return create_teacher(district, create_school(district), "other_teacher")
 
 
 class TestStudentRoutes:
@@ -69,11 +76,12 @@ class TestStudentRoutes:
         assert student.character_name.encode() in resp.data
 
     def test_student_detail_blocks_unauthorized_access(
-        self, client, teacher_user, student_factory, teacher_factory
+        self, client, teacher_user, student_factory
     ):
         """Test that teachers can't access other teachers' students."""
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
         student = student_factory(teacher_id=other_teacher.id)
+        assert student.teacher_id == other_teacher.id != teacher_user.id
 
         with client.session_transaction() as sess:
             sess["_user_id"] = str(teacher_user.id)
@@ -95,12 +103,11 @@ class TestStudentRoutes:
         assert data["success"] is True
         assert "deleted successfully" in data["message"]
 
-    def test_delete_student_unauthorized(
-        self, client, teacher_user, student_factory, teacher_factory
-    ):
+    def test_delete_student_unauthorized(self, client, teacher_user, student_factory):
         """Test that teachers can't delete other teachers' students."""
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
         student = student_factory(teacher_id=other_teacher.id)
+        assert student.teacher_id == other_teacher.id != teacher_user.id
 
         with client.session_transaction() as sess:
             sess["_user_id"] = str(teacher_user.id)
@@ -203,11 +210,12 @@ class TestPinCardsRoutes:
         assert resp.headers["Content-Type"] == "application/pdf"
 
     def test_generate_pin_cards_unauthorized_session(
-        self, client, teacher_user, session_factory, teacher_factory
+        self, client, teacher_user, session_factory
     ):
         """Test PIN cards generation with unauthorized session access."""
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
         session = session_factory(created_by_id=other_teacher.id)
+        assert session.created_by_id == other_teacher.id != teacher_user.id
 
         with client.session_transaction() as sess:
             sess["_user_id"] = str(teacher_user.id)
@@ -241,12 +249,11 @@ class TestStudentServiceIntegration:
         assert student1 in students
         assert student2 in students
 
-    def test_get_student_with_ownership_check(
-        self, teacher_user, student_factory, teacher_factory
-    ):
+    def test_get_student_with_ownership_check(self, teacher_user, student_factory):
         """Test ownership verification for student access."""
         student = student_factory(teacher_id=teacher_user.id)
-        other_teacher = teacher_factory()
+        other_teacher = _create_other_teacher()
+        assert other_teacher.id != student.teacher_id
 
         # Teacher can access their own student
         result = StudentService.get_student_with_ownership_check(
@@ -42,6 +42,18 @@ class TestDistrictModel:
             with pytest.raises(Exception):  # Should raise IntegrityError
                 db.session.commit()
 
+    def test_district_get_or_create_id(self, app):
+        """get_or_create_id inserts once and returns the same row afterwards."""
+        with app.app_context():
+            existing = District(name="Existing District")
+            db.session.add(existing)
+            db.session.commit()
+
+            assert District.get_or_create_id("Existing District") == existing.id
+            new_id = District.get_or_create_id("New District")
+            assert District.get_or_create_id("New District") == new_id
+            assert District.query.filter_by(name="New District").count() == 1
+
     def test_district_code_unique(self, app):
         """Test that district codes must be unique when provided."""
         with app.app_context():
@@ -1,5 +1,5 @@
 import pytest
-from werkzeug.security import generate_password_hash
+from werkzeug.security import check_password_hash, generate_password_hash
 
 from models import Module, Session, User, db
 from services.session_service import SessionConflictError, SessionService
@@ -246,3 +246,11 @@ def test_generate_students_for_session(app, teacher, module):
         # Check uniqueness
         names = [s.character_name for s in students]
         assert len(names) == len(set(names))  # All names unique
+
+        # The login and PIN credentials are the same hash of the same PIN
+        assert all(student.password_hash == student.pin_hash for student in students)
+        # The plain PIN is kept for teachers and for the keyed student login
+        assert all(
+            check_password_hash(student.pin_hash, student.current_pin)
+            for student in students
+        )
@@ -0,0 +1,98 @@
+"""Tests for the process-local TTL caches and their write invalidation."""
+
+import pytest
+
+from models import District, Module, Observer, School, User, db
+from services import _ttl_cache
+from services.dashboard_counts import get_user_counts
+from services.dashboard_lists import get_dashboard_lists
+from services.login_choices import get_district_choices
+from services.module_choices import get_module_choices
+
+
+def _core_district(_district):
+    return District.__table__.insert().values(name="Core District", code="CORE")
+
+
+def _core_user(district):
+    return User.__table__.insert().values(
+        username="core",
+        email="core@example.com",
+        password_hash="x",
+        role=User.Role.STAFF.name,
+        type="user",
+        district_id=district.id,
+    )
+
+
+def _core_module(_district):
+    return Module.__table__.insert().values(name="Core Module", is_active=True)
+
+
+def _orm_module(_district):
+    return Module(name="ORM Module")
+
+
+def _orm_district(_district):
+    return District(name="ORM District", code="ORM")
+
+
+def _orm_school(district):
+    return School(name="ORM School", code="ORMS", district_id=district.id)
+
+
+def _orm_observer(district):
+    # An Observer row checks that subclass writes reach the User listener
+    return Observer(
+        username="orm",
+        email="orm@example.com",
+        password_hash="x",
+        role=User.Role.OBSERVER,
+        district_id=district.id,
+    )
+
+
+CACHES = [
+    pytest.param(get_district_choices, _core_district, _orm_district, id="login"),
+    pytest.param(get_dashboard_lists, _core_district, _orm_school, id="lists"),
+    pytest.param(get_user_counts, _core_user, _orm_observer, id="counts"),
+    pytest.param(get_module_choices, _core_module, _orm_module, id="modules"),
+]
+
+
+@pytest.mark.parametrize("load, core_write, orm_write", CACHES)
+def test_cache_kept_until_an_orm_write(app, load, core_write, orm_write):
+    district = District(name="Cached District", code="CACHED")
+    db.session.add(district)
+    db.session.commit()
+    first = load()
+
+    # A write that bypasses the ORM does not fire mapper events
+    db.session.execute(core_write(district))
+    assert load() == first
+
+    db.session.add(orm_write(district))
+    db.session.commit()
+    assert load() != first
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_ttl_cache.time, "monotonic", lambda: now[0])
+    calls = []
+
+    @_ttl_cache.cached(lambda *args: args, ttl=30)
+    def load(value):
+        calls.append(value)
+        return value * 2
+
+    assert (load(2), load(2), load(3)) == (4, 4, 6)
+    assert calls == [2, 3]
+
+    now[0] += 30
+    assert load(2) == 4
+    assert calls == [2, 3, 2]
+
+    load.cache_clear()
+    load(3)
+    assert calls == [2, 3, 2, 3]